@@ -14,11 +14,25 @@ Implements advanced analysis metrics for institutional networks:
 - Information asymmetry
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple, Optional
 import networkx as nx
 import numpy as np
-from scipy.stats import entropy
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Path dependence keeps one reachability bitset of V bits per strongly
+# connected component; above this size the per-successor traversal is used
+_BITSET_MAX_NODES = 20000
 
 
 @dataclass
@@ -57,6 +71,53 @@ class InformationAsymmetryResult:
     gini_coefficient: float
 
 
+@njit(cache=True)
+def _cascade_kernel(
+    start, indptr, indices, pred_indptr, pred_indices, in_deg, threshold, max_steps
+):
+    """
+    Threshold cascade over CSR successor/predecessor arrays.
+    
+    Returns node indices in activation order, wave by wave.
+    """
+    n = in_deg.shape[0]
+    activated = np.zeros(n, dtype=np.bool_)
+    queued = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int64)
+    activated[start] = True
+    order[0] = start
+    count = 1
+    wave_start = 0
+    
+    for _ in range(max_steps):
+        wave_end = count
+        for w in range(wave_start, count):
+            node = order[w]
+            for k in range(indptr[node], indptr[node + 1]):
+                successor = indices[k]
+                if activated[successor] or queued[successor]:
+                    continue
+                # Check if activation threshold met
+                active_predecessors = 0
+                for m in range(pred_indptr[successor], pred_indptr[successor + 1]):
+                    if activated[pred_indices[m]]:
+                        active_predecessors += 1
+                if active_predecessors / in_deg[successor] >= threshold:
+                    queued[successor] = True
+                    order[wave_end] = successor
+                    wave_end += 1
+        
+        if wave_end == count:
+            break
+        
+        for w in range(count, wave_end):
+            activated[order[w]] = True
+        wave_start = count
+        count = wave_end
+    
+    return order[:count]
+
+
 class AdvancedInstitutionalMetrics:
     """
     Computes advanced institutional network metrics.
@@ -68,6 +129,77 @@ class AdvancedInstitutionalMetrics:
         """
         self.graph = graph
         self.layers = layers or {}
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        """
+        Drop cached graph views.
+        
+        Must be called after self.graph is mutated in place.
+        """
+        self._degree_cache: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None
+        self._csr_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+        self._depth_counts_cache: Optional[np.ndarray] = None
+        self._idx: Optional[Dict[str, int]] = None
+        self._nk_graph = None
+    
+    def _degree_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Return the node list with aligned in/out-degree arrays.
+        
+        Pulled from the graph in one pass and reused until _invalidate().
+        """
+        if self._degree_cache is None:
+            node_list = list(self.graph.nodes())
+            n = len(node_list)
+            in_deg = np.fromiter(
+                (d for _, d in self.graph.in_degree()), dtype=np.int32, count=n
+            )
+            out_deg = np.fromiter(
+                (d for _, d in self.graph.out_degree()), dtype=np.int32, count=n
+            )
+            self._degree_cache = (node_list, in_deg, out_deg)
+        return self._degree_cache
+    
+    def _node_index(self) -> Dict[str, int]:
+        """Position of each node in the _degree_arrays() node list."""
+        if self._idx is None:
+            node_list, _, _ = self._degree_arrays()
+            self._idx = {n: i for i, n in enumerate(node_list)}
+        return self._idx
+    
+    def _csr_adjacency(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return (indptr, indices) for successors and for predecessors.
+        
+        Rows are aligned with the node list from _degree_arrays().
+        """
+        if self._csr_cache is None:
+            node_list, _, _ = self._degree_arrays()
+            A = nx.to_scipy_sparse_array(
+                self.graph, nodelist=node_list, weight=None, format='csr'
+            )
+            A_pred = A.T.tocsr()
+            self._csr_cache = (A.indptr, A.indices, A_pred.indptr, A_pred.indices)
+        return self._csr_cache
+    
+    def _depth_counts(self) -> np.ndarray:
+        """
+        Return a (V, 4) array counting nodes at shortest distance 0..3.
+        
+        Each row comes from a single BFS truncated at depth 3.
+        """
+        if self._depth_counts_cache is None:
+            node_list, _, _ = self._degree_arrays()
+            counts = np.zeros((len(node_list), 4), dtype=np.int64)
+            for i, node in enumerate(node_list):
+                lengths = nx.single_source_shortest_path_length(self.graph, node, cutoff=3)
+                counts[i] = np.bincount(
+                    np.fromiter(lengths.values(), dtype=np.int64, count=len(lengths)),
+                    minlength=4
+                )
+            self._depth_counts_cache = counts
+        return self._depth_counts_cache
     
     def analyze_constraint_dominance(
         self,
@@ -76,32 +208,48 @@ class AdvancedInstitutionalMetrics:
         """
         Analyze which constraints dominate decision-making paths.
         
-        Constraint dominance measures how often a constraint node
-        lies on paths between decision nodes and outcome nodes.
+        Constraint dominance measures the fraction of reachable
+        (decision, outcome) pairs that can be routed through a constraint
+        node within `cutoff` hops.
         """
+        cutoff = 5
         dominance_scores: Dict[str, float] = {c: 0.0 for c in constraint_nodes}
         
         # Find all decision nodes (high out-degree) and outcome nodes (high in-degree)
-        decision_nodes = [n for n in self.graph.nodes() 
-                        if self.graph.out_degree(n) > self.graph.in_degree(n)]
-        outcome_nodes = [n for n in self.graph.nodes() 
-                        if self.graph.in_degree(n) > self.graph.out_degree(n)]
+        node_list, in_deg, out_deg = self._degree_arrays()
+        decision_nodes = [node_list[i] for i in np.flatnonzero(out_deg > in_deg)]
+        outcome_nodes = [node_list[i] for i in np.flatnonzero(in_deg > out_deg)]
+        decision_set = set(decision_nodes)
+        outcome_set = set(outcome_nodes)
         
-        # Count constraint appearances on paths
+        # Count (decision, outcome) pairs connected within the cutoff
         path_count = 0
-        for decision in decision_nodes[:50]:  # Limit for performance
-            for outcome in outcome_nodes[:50]:
-                try:
-                    paths = list(nx.all_simple_paths(
-                        self.graph, decision, outcome, cutoff=5
-                    ))
-                    for path in paths:
-                        path_count += 1
-                        for constraint in constraint_nodes:
-                            if constraint in path:
-                                dominance_scores[constraint] += 1
-                except nx.NetworkXNoPath:
-                    continue
+        for decision in decision_nodes:
+            reachable = nx.single_source_shortest_path_length(
+                self.graph, decision, cutoff=cutoff
+            )
+            path_count += sum(1 for n in reachable if n in outcome_set)
+        
+        # A pair (d, o) routes through constraint c when dist(d, c) + dist(c, o)
+        # <= cutoff, so two truncated BFS runs per constraint are enough
+        reverse = self.graph.reverse(copy=False)
+        for constraint in dominance_scores:
+            if constraint not in self.graph:
+                continue
+            backward = np.bincount([
+                d for n, d in nx.single_source_shortest_path_length(
+                    reverse, constraint, cutoff=cutoff
+                ).items() if n in decision_set
+            ], minlength=cutoff + 1)
+            forward = np.bincount([
+                d for n, d in nx.single_source_shortest_path_length(
+                    self.graph, constraint, cutoff=cutoff
+                ).items() if n in outcome_set
+            ], minlength=cutoff + 1)
+            # Pair backward distance k with every forward distance <= cutoff - k
+            dominance_scores[constraint] = float(
+                np.dot(backward, np.cumsum(forward)[::-1])
+            )
         
         # Normalize scores
         if path_count > 0:
@@ -177,10 +325,14 @@ class AdvancedInstitutionalMetrics:
             else:
                 thresholds[subgraph_id] = 1.0
         
-        # Simulate activation cascades
+        # Simulate activation cascades over one shared CSR view
+        node_list, in_deg, _ = self._degree_arrays()
+        csr = self._csr_adjacency()
         cascades = []
         for trigger in trigger_nodes[:5]:
-            cascade = self._simulate_cascade(trigger, activation_threshold)
+            cascade = self._simulate_cascade(
+                trigger, activation_threshold, node_list, in_deg, csr
+            )
             if len(cascade) > 1:
                 cascades.append(cascade)
         
@@ -195,33 +347,24 @@ class AdvancedInstitutionalMetrics:
         self,
         start_node: str,
         threshold: float,
+        node_list: List[str],
+        in_deg: np.ndarray,
+        csr: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
         max_steps: int = 10
     ) -> List[str]:
-        """Simulate activation cascade from a starting node."""
-        activated = [start_node]
-        current = {start_node}
-        
-        for _ in range(max_steps):
-            next_wave = set()
-            for node in current:
-                for successor in self.graph.successors(node):
-                    if successor not in activated:
-                        # Check if activation threshold met
-                        active_predecessors = sum(
-                            1 for p in self.graph.predecessors(successor) if p in activated
-                        )
-                        all_predecessors = self.graph.in_degree(successor)
-                        
-                        if all_predecessors > 0 and active_predecessors / all_predecessors >= threshold:
-                            next_wave.add(successor)
-            
-            if not next_wave:
-                break
-            
-            activated.extend(next_wave)
-            current = next_wave
+        """
+        Simulate activation cascade from a starting node.
+        
+        node_list, in_deg and csr come from _degree_arrays() and
+        _csr_adjacency(), fetched once by the caller.
+        """
+        indptr, indices, pred_indptr, pred_indices = csr
         
-        return activated
+        order = _cascade_kernel(
+            self._node_index()[start_node], indptr, indices, pred_indptr, pred_indices,
+            in_deg, float(threshold), max_steps
+        )
+        return [node_list[i] for i in order]
     
     def analyze_path_dependence(self) -> PathDependenceResult:
         """
@@ -231,36 +374,43 @@ class AdvancedInstitutionalMetrics:
         future outcomes.
         """
         # Find critical junctions (nodes with multiple outgoing paths)
-        critical_junctions = [
-            n for n in self.graph.nodes()
-            if self.graph.out_degree(n) >= 2
-        ]
+        node_list, _, out_deg = self._degree_arrays()
+        critical_junctions = [node_list[i] for i in np.flatnonzero(out_deg >= 2)]
         
         # Path-dependent nodes: nodes reachable through only one junction
-        path_dependent: Dict[str, Set[str]] = {}
-        
-        for junction in critical_junctions:
-            successors = list(self.graph.successors(junction))
-            for succ in successors:
-                reachable = nx.descendants(self.graph, succ)
-                for node in reachable:
-                    if node not in path_dependent:
-                        path_dependent[node] = set()
-                    path_dependent[node].add(junction)
-        
-        # Nodes dependent on single junction
-        single_path_dependent = [
-            n for n, junctions in path_dependent.items()
-            if len(junctions) == 1
-        ]
-        
-        # Count alternative histories
+        if len(node_list) <= _BITSET_MAX_NODES:
+            single_path_dependent = [
+                node_list[i] for i in self._single_junction_dependents(out_deg >= 2)
+            ]
+        else:
+            path_dependent: Dict[str, Set[str]] = defaultdict(set)
+            
+            # Junctions often share successors; traverse from each one only once
+            desc_of: Dict[str, Set[str]] = {}
+            
+            for junction in critical_junctions:
+                successors = list(self.graph.successors(junction))
+                for succ in successors:
+                    if succ not in desc_of:
+                        desc_of[succ] = nx.descendants(self.graph, succ)
+                    reachable = desc_of[succ]
+                    for node in reachable:
+                        path_dependent[node].add(junction)
+            
+            # Nodes dependent on single junction
+            single_path_dependent = [
+                n for n, junctions in path_dependent.items()
+                if len(junctions) == 1
+            ]
+        
+        # Count alternative histories: nodes within three hops of a junction,
+        # found by distance alone without materializing each path
         alternative_histories = 0
         for junction in critical_junctions[:10]:
-            paths_from_junction = list(nx.single_source_shortest_path(
+            reachable = nx.single_source_shortest_path_length(
                 self.graph, junction, cutoff=3
-            ))
-            alternative_histories += max(0, len(paths_from_junction) - 1)
+            )
+            alternative_histories += max(0, len(reachable) - 1)
         
         # Lock-in score: fraction of nodes with single-path dependency
         lock_in = len(single_path_dependent) / len(self.graph.nodes()) if self.graph.nodes() else 0
@@ -272,6 +422,68 @@ class AdvancedInstitutionalMetrics:
             lock_in_score=lock_in
         )
     
+    def _single_junction_dependents(self, is_junction: np.ndarray) -> np.ndarray:
+        """
+        Indices of nodes that descend from exactly one junction.
+        
+        A node depends on junction j when it is a descendant of one of j's
+        successors. Reachability is kept as uint64 bitsets (64 nodes per
+        word) on the condensation DAG, ORed up in reverse topological order,
+        so each junction's dependents are the OR of its successors' sets.
+        """
+        node_list, _, _ = self._degree_arrays()
+        indptr, indices, _, _ = self._csr_adjacency()
+        n = len(node_list)
+        words = (n + 63) // 64
+        
+        A = sparse.csr_array((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n))
+        n_comp, labels = connected_components(A, directed=True, connection='strong')
+        
+        # Condensation DAG as CSR over components
+        src = np.repeat(np.arange(n), np.diff(indptr))
+        cu, cv = labels[src], labels[indices]
+        cross = cu != cv
+        cond = sparse.csr_array(
+            (np.ones(int(cross.sum()), dtype=np.int8), (cu[cross], cv[cross])),
+            shape=(n_comp, n_comp)
+        )
+        cond.sum_duplicates()
+        
+        # Topological order of the condensation (Kahn's algorithm); the
+        # list grows while it is walked, so every component is visited
+        indegree = np.bincount(cond.indices, minlength=n_comp)
+        order = np.flatnonzero(indegree == 0).tolist()
+        for c in order:
+            for d in cond.indices[cond.indptr[c]:cond.indptr[c + 1]].tolist():
+                indegree[d] -= 1
+                if indegree[d] == 0:
+                    order.append(d)
+        
+        # star[c]: every node reachable from component c, its own members included
+        node_ids = np.arange(n)
+        node_word = node_ids >> 6
+        node_bit = np.left_shift(np.uint64(1), (node_ids & 63).astype(np.uint64))
+        star = np.zeros((n_comp, words), dtype=np.uint64)
+        np.bitwise_or.at(star, (labels, node_word), node_bit)
+        for c in reversed(order):
+            succ = cond.indices[cond.indptr[c]:cond.indptr[c + 1]]
+            if succ.size:
+                star[c] |= np.bitwise_or.reduce(star[succ], axis=0)
+        
+        once = np.zeros(words, dtype=np.uint64)
+        twice = np.zeros(words, dtype=np.uint64)
+        for j in np.flatnonzero(is_junction):
+            succ = indices[indptr[j]:indptr[j + 1]]
+            # Descendants of s exclude s itself, even when s lies on a cycle
+            reach = star[labels[succ]]
+            reach[np.arange(succ.size), node_word[succ]] &= ~node_bit[succ]
+            dependents = np.bitwise_or.reduce(reach, axis=0)
+            twice |= once & dependents
+            once |= dependents
+        
+        single = (once & ~twice).astype('<u8').view(np.uint8)
+        return np.flatnonzero(np.unpackbits(single, bitorder='little')[:n])
+    
     def measure_information_asymmetry(self) -> InformationAsymmetryResult:
         """
         Measure information asymmetry in the network.
@@ -292,33 +504,47 @@ class AdvancedInstitutionalMetrics:
         else:
             access_scores = nx.closeness_centrality(self.graph)
         
-        # Find asymmetric pairs
-        asymmetric_pairs = []
-        nodes = list(self.graph.nodes())
-        
-        for i, n1 in enumerate(nodes[:100]):
-            for n2 in nodes[i+1:100]:
-                score_diff = abs(access_scores.get(n1, 0) - access_scores.get(n2, 0))
-                if score_diff > 0.3:  # Significant asymmetry
-                    asymmetric_pairs.append((n1, n2, score_diff))
+        # Find asymmetric pairs among the first 100 nodes
+        nodes = list(self.graph.nodes())[:100]
+        node_scores = np.array([access_scores.get(n, 0) for n in nodes], dtype=np.float64)
+        rows, cols = np.triu_indices(len(nodes), k=1)
+        diffs = np.abs(node_scores[:, None] - node_scores[None, :])[rows, cols]
+        significant = np.flatnonzero(diffs > 0.3)  # Significant asymmetry
+        
+        # Keep the 50 most asymmetric pairs; ties at the cut keep scan order
+        if significant.size > 50:
+            candidate_diffs = diffs[significant]
+            cut = np.partition(candidate_diffs, -50)[-50]
+            above = significant[candidate_diffs > cut]
+            ties = significant[candidate_diffs == cut][:50 - above.size]
+            significant = np.sort(np.concatenate([above, ties]))
         
         # Sort by asymmetry
-        asymmetric_pairs.sort(key=lambda x: -x[2])
+        order = significant[np.argsort(-diffs[significant], kind='stable')]
+        asymmetric_pairs = [
+            (nodes[rows[k]], nodes[cols[k]], float(diffs[k])) for k in order
+        ]
+        
+        scores = np.sort(np.fromiter(
+            access_scores.values(), dtype=np.float64, count=len(access_scores)
+        ))
+        if scores.size:
+            periphery_threshold, threshold = np.percentile(scores, [10, 90])
+        else:
+            periphery_threshold = threshold = 0
         
         # Information hubs (top 10%)
-        threshold = np.percentile(list(access_scores.values()), 90) if access_scores else 0
         hubs = [n for n, s in access_scores.items() if s >= threshold]
         
         # Information periphery (bottom 10%)
-        periphery_threshold = np.percentile(list(access_scores.values()), 10) if access_scores else 0
         periphery = [n for n, s in access_scores.items() if s <= periphery_threshold]
         
         # Gini coefficient of information access
-        scores = sorted(access_scores.values())
-        n = len(scores)
-        if n > 0 and sum(scores) > 0:
-            numerator = sum((2 * i - n + 1) * s for i, s in enumerate(scores))
-            gini = numerator / (n * sum(scores))
+        n = scores.size
+        total = scores.sum()
+        if n > 0 and total > 0:
+            idx = np.arange(n, dtype=np.float64)
+            gini = float(np.dot(2 * idx - n + 1, scores) / (n * total))
         else:
             gini = 0.0
         
@@ -339,30 +565,87 @@ class AdvancedInstitutionalMetrics:
         Higher values indicate more meta-stable (less stable) configurations.
         """
         # Based on network entropy and degree distribution
-        degrees = [d for n, d in self.graph.degree()]
-        if not degrees:
+        n = self.graph.number_of_nodes()
+        if n == 0:
             return 0.0
+        if self.graph.is_directed():
+            _, in_deg, out_deg = self._degree_arrays()
+            degrees = in_deg.astype(np.int64) + out_deg
+        else:
+            degrees = np.fromiter(
+                (d for _, d in self.graph.degree()), dtype=np.int64, count=n
+            )
         
         # Degree distribution entropy
-        degree_dist = np.bincount(degrees) / len(degrees)
+        degree_dist = np.bincount(degrees) / n
         degree_dist = degree_dist[degree_dist > 0]
-        degree_entropy = entropy(degree_dist)
+        degree_entropy = -np.dot(degree_dist, np.log(degree_dist))
         
         # Clustering variability
-        try:
-            clustering = list(nx.clustering(self.graph).values())
-            clustering_std = np.std(clustering) if clustering else 0
-        except:
-            clustering_std = 0
+        clustering_std = self._local_clustering().std()
         
         # Combine into meta-stability score
-        max_entropy = np.log(len(self.graph.nodes())) if self.graph.nodes() else 1
+        max_entropy = np.log(n)
         normalized_entropy = degree_entropy / max_entropy if max_entropy > 0 else 0
         
         meta_stability = (normalized_entropy + clustering_std) / 2
         
         return max(0, min(1, meta_stability))
     
+    def _local_clustering(self) -> np.ndarray:
+        """
+        Local clustering coefficients in graph node order, as nx.clustering.
+        
+        Undirected graphs use networkit's parallel implementation when it is
+        installed. Otherwise triangles come from sparse products; for directed
+        graphs, with S = A + A^T and self-loops dropped, node i closes
+        (S^3)_ii directed triangles.
+        """
+        if not self.graph.is_directed():
+            scores = self._networkit_clustering()
+            if scores is not None:
+                return scores
+        
+        n = self.graph.number_of_nodes()
+        A = nx.to_scipy_sparse_array(self.graph, weight=None, dtype=np.int64, format='csr')
+        A.setdiag(0)
+        A.eliminate_zeros()
+        
+        if self.graph.is_directed():
+            S = A + A.T
+            bidirectional = np.asarray(A.multiply(A.T).sum(axis=1)).ravel()
+        else:
+            S = A
+        
+        triangles = np.asarray((S @ S).multiply(S).sum(axis=1)).ravel()
+        degree = np.asarray(S.sum(axis=1)).ravel()
+        possible = degree * (degree - 1)
+        if self.graph.is_directed():
+            possible = 2 * (possible - 2 * bidirectional)
+        return np.divide(
+            triangles, possible,
+            out=np.zeros(n), where=triangles > 0
+        )
+    
+    def _networkit_clustering(self) -> Optional[np.ndarray]:
+        """
+        Undirected local clustering via networkit, or None if not installed.
+        
+        The converted graph is cached until _invalidate().
+        """
+        try:
+            import networkit as nk
+        except ImportError:
+            return None
+        
+        if self._nk_graph is None:
+            self._nk_graph = nk.nxadapter.nx2nk(self.graph)
+            self._nk_graph.removeSelfLoops()
+        
+        lcc = nk.centrality.LocalClusteringCoefficient(self._nk_graph)
+        lcc.run()
+        return np.asarray(lcc.scores(), dtype=np.float64)
+    
     def analyze_structural_optionality(self) -> Dict[str, float]:
         """
         Compute structural optionality for each node.
@@ -370,24 +653,23 @@ class AdvancedInstitutionalMetrics:
         Optionality measures how many alternative paths/outcomes
         are available from a node, weighted by their viability.
         """
-        optionality: Dict[str, float] = {}
+        node_list, _, out_deg = self._degree_arrays()
         
-        for node in self.graph.nodes():
-            # Count reachable nodes at different depths
-            reachable_1 = len(list(self.graph.successors(node)))
-            reachable_2 = len(list(nx.descendants_at_distance(self.graph, node, 2)))
-            reachable_3 = len(list(nx.descendants_at_distance(self.graph, node, 3)))
-            
-            # Weight by depth (closer options are more valuable)
-            total = self.graph.number_of_nodes() - 1
-            if total > 0:
-                optionality[node] = (
-                    3 * reachable_1 + 2 * reachable_2 + reachable_3
-                ) / (6 * total)
-            else:
-                optionality[node] = 0.0
+        total = len(node_list) - 1
+        if total <= 0:
+            return {node: 0.0 for node in node_list}
+        
+        # Count reachable nodes at different depths; direct options are
+        # successors, so a self-loop still counts as one
+        depth = self._depth_counts()
+        reachable_1 = out_deg
+        reachable_2 = depth[:, 2]
+        reachable_3 = depth[:, 3]
         
-        return optionality
+        # Weight by depth (closer options are more valuable)
+        scores = (3 * reachable_1 + 2 * reachable_2 + reachable_3) / (6 * total)
+        
+        return dict(zip(node_list, scores.tolist()))
     
     def detect_endogenous_risk(self) -> Dict[str, float]:
         """
@@ -395,33 +677,35 @@ class AdvancedInstitutionalMetrics:
         
         Endogenous risk arises from network structure itself,
         particularly from cycles and feedback loops.
+        
+        Every node of a non-trivial strongly connected component lies on
+        a cycle, so cycle participation is the size of the node's
+        component rather than a count of enumerated cycles.
         """
         risk_scores: Dict[str, float] = {}
         
-        # Find cycles
-        try:
-            cycles = list(nx.simple_cycles(self.graph))
-        except:
-            cycles = []
-        
-        # Nodes in more cycles have higher endogenous risk
+        # Nodes in larger feedback structures have higher endogenous risk
         cycle_participation: Dict[str, int] = {}
-        for cycle in cycles[:1000]:  # Limit for performance
-            for node in cycle:
-                cycle_participation[node] = cycle_participation.get(node, 0) + 1
+        for component in nx.strongly_connected_components(self.graph):
+            if len(component) == 1:
+                node = next(iter(component))
+                if not self.graph.has_edge(node, node):
+                    continue
+            for node in component:
+                cycle_participation[node] = len(component)
         
         max_participation = max(cycle_participation.values()) if cycle_participation else 1
         
-        for node in self.graph.nodes():
-            participation = cycle_participation.get(node, 0)
-            
-            # Also consider in-degree (concentrated risk)
-            in_degree = self.graph.in_degree(node)
-            max_in = max(d for n, d in self.graph.in_degree()) if self.graph.nodes() else 1
-            
-            risk_scores[node] = (
-                0.7 * (participation / max_participation) +
-                0.3 * (in_degree / max_in)
-            )
+        node_list, in_deg, _ = self._degree_arrays()
+        participation = np.fromiter(
+            (cycle_participation.get(n, 0) for n in node_list),
+            dtype=np.float64, count=len(node_list)
+        )
+        
+        # Also consider in-degree (concentrated risk)
+        max_in = int(in_deg.max()) if in_deg.size and in_deg.max() > 0 else 1
+        
+        risk = 0.7 * (participation / max_participation) + 0.3 * (in_deg / max_in)
+        risk_scores.update(zip(node_list, risk.tolist()))
         
         return risk_scores
@@ -6,10 +6,21 @@ for signed multiplex networks as defined in academic literature.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import networkx as nx
 import numpy as np
+from scipy import sparse
 from scipy.optimize import minimize
+from scipy.sparse.linalg import eigsh
+
+
+# Below this size a dense eigendecomposition beats ARPACK setup cost
+_DENSE_EIGEN_MAX_NODES = 128
+
+# Shift-invert target for the two smallest Laplacian eigenpairs. The
+# signed Laplacian is singular on balanced graphs, so sigma=0 cannot be
+# factorized; a small negative shift keeps (L - sigma*I) positive definite.
+_FIEDLER_SHIFT = -1e-3
 
 
 @dataclass
@@ -48,15 +59,31 @@ class SignedNetworkAnalyzer:
         sign = 1 for positive edges, sign = -1 for negative edges.
         """
         self.graph = graph
-        self._validate_graph()
+        self._invalidate()
+        # Validate signs up front rather than on first analysis
+        self._edge_arrays()
+    
+    def _invalidate(self) -> None:
+        """
+        Drop cached graph views.
+        
+        Must be called after self.graph is mutated in place.
+        """
+        self._edge_cache: Optional[
+            Tuple[List[str], Dict[str, int], np.ndarray, np.ndarray, np.ndarray]
+        ] = None
+        self._matrix_cache: Optional[Tuple[List[str], Dict[str, int], sparse.csr_matrix]] = None
+        self._spectral_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._frustration_cache: Optional[int] = None
     
-    def _validate_graph(self) -> None:
+    def _validate_graph(self, edges: List[Tuple], signs: np.ndarray) -> None:
         """Ensure all edges have valid sign attributes."""
-        for u, v, data in self.graph.edges(data=True):
-            if 'sign' not in data:
+        invalid = ~((signs == 1) | (signs == -1))
+        if invalid.any():
+            u, v, sign = edges[int(np.argmax(invalid))]
+            if 'sign' not in self.graph[u][v]:
                 raise ValueError(f"Edge ({u}, {v}) missing 'sign' attribute")
-            if data['sign'] not in (-1, 1):
-                raise ValueError(f"Edge ({u}, {v}) has invalid sign: {data['sign']}")
+            raise ValueError(f"Edge ({u}, {v}) has invalid sign: {sign}")
     
     def compute_frustration_index(self) -> int:
         """
@@ -68,55 +95,174 @@ class SignedNetworkAnalyzer:
         Uses an approximation algorithm based on spectral clustering
         for large graphs.
         """
-        if self.graph.number_of_nodes() == 0:
-            return 0
-        
-        if self.graph.number_of_nodes() <= 20:
-            # Exact computation for small graphs
-            return self._compute_frustration_exact()
-        else:
-            # Approximation for larger graphs
-            return self._compute_frustration_approximate()
+        if self._frustration_cache is None:
+            n = len(self._edge_arrays()[0])
+            if n == 0:
+                frustration = 0
+            elif n <= 20:
+                # Exact computation for small graphs
+                frustration = self._compute_frustration_exact()
+            else:
+                # Approximation for larger graphs
+                frustration = self._compute_frustration_approximate()
+            self._frustration_cache = frustration
+        
+        return self._frustration_cache
     
     def _compute_frustration_exact(self) -> int:
         """
         Exact frustration index computation via enumeration.
         Exponential complexity - only for small graphs.
+        
+        Bipartitions are visited in Gray-code order, so each step moves a
+        single node across the cut and the frustrated-edge count is
+        updated from that node's neighbor bitmasks with two popcounts.
+        A partition and its complement frustrate the same edges, so the
+        last node stays fixed and only 2^(n-1) partitions are visited.
         """
-        nodes = list(self.graph.nodes())
+        nodes, _, edges_u, edges_v, edge_signs = self._edge_arrays()
         n = len(nodes)
-        min_frustration = float('inf')
         
-        # Try all possible bipartitions
-        for mask in range(2 ** n):
-            partition = [nodes[i] for i in range(n) if mask & (1 << i)]
-            frustration = self._count_frustrated_edges(set(partition))
+        # Per-node neighbor bitmasks by sign (self-loops never change state)
+        positive = [0] * n
+        negative = [0] * n
+        for u, v, sign in zip(edges_u.tolist(), edges_v.tolist(), edge_signs.tolist()):
+            if u == v:
+                continue
+            masks = positive if sign == 1 else negative
+            masks[u] |= 1 << v
+            masks[v] |= 1 << u
+        degree = [positive[i].bit_count() + negative[i].bit_count() for i in range(n)]
+        
+        # All nodes start on one side, so exactly the negative edges are frustrated
+        frustration = int(np.count_nonzero(edge_signs == -1))
+        min_frustration = frustration
+        side = 0
+        
+        for step in range(1, 2 ** (n - 1)):
+            if min_frustration == 0:
+                break
+            k = (step & -step).bit_length() - 1
+            same = side if (side >> k) & 1 else ~side
+            # Incident edges frustrated before the flip become satisfied and vice versa
+            before = (positive[k] & ~same).bit_count() + (negative[k] & same).bit_count()
+            frustration += degree[k] - 2 * before
+            side ^= 1 << k
             min_frustration = min(min_frustration, frustration)
         
-        return int(min_frustration)
+        return min_frustration
+    
+    def _edge_arrays(
+        self
+    ) -> Tuple[List[str], Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Edge endpoints and signs as parallel arrays.
+        
+        Returns (nodes, node_idx, edges_u, edges_v, edge_signs): edges_u and
+        edges_v index into nodes in graph edge order and edge_signs holds
+        the matching int8 signs. Built and validated once, until
+        _invalidate().
+        """
+        if self._edge_cache is None:
+            nodes = list(self.graph.nodes())
+            node_idx = {node: i for i, node in enumerate(nodes)}
+            edges = list(self.graph.edges(data='sign'))
+            m = len(edges)
+            signs = np.empty(m, dtype=object)
+            signs[:] = [sign for _, _, sign in edges]
+            self._validate_graph(edges, signs)
+            
+            edges_u = np.fromiter((node_idx[u] for u, _, _ in edges), dtype=np.int32, count=m)
+            edges_v = np.fromiter((node_idx[v] for _, v, _ in edges), dtype=np.int32, count=m)
+            self._edge_cache = (nodes, node_idx, edges_u, edges_v, signs.astype(np.int8))
+        
+        return self._edge_cache
     
-    def _count_frustrated_edges(self, partition: Set[str]) -> int:
+    def _frustrated_edge_mask(self, partition_mask: np.ndarray) -> np.ndarray:
         """
-        Count frustrated edges given a bipartition.
+        Flag frustrated edges given a boolean bipartition over nodes.
         
         An edge is frustrated if:
         - It's positive and crosses the partition (different groups)
         - It's negative and doesn't cross (same group)
         """
-        frustrated = 0
+        _, _, edges_u, edges_v, edge_signs = self._edge_arrays()
+        same_partition = partition_mask[edges_u] == partition_mask[edges_v]
+        return (
+            ((edge_signs == 1) & ~same_partition) |
+            ((edge_signs == -1) & same_partition)
+        )
+    
+    def _count_frustrated_edges(self, partition_mask: np.ndarray) -> int:
+        """Count frustrated edges given a boolean bipartition over nodes."""
+        return int(np.count_nonzero(self._frustrated_edge_mask(partition_mask)))
+    
+    def _build_signed_matrices(
+        self
+    ) -> Tuple[List[str], Dict[str, int], sparse.csr_matrix]:
+        """
+        Symmetric sparse signed adjacency matrix.
         
-        for u, v, data in self.graph.edges(data=True):
-            sign = data['sign']
-            same_partition = (u in partition) == (v in partition)
+        Returns (nodes, node_idx, A) with self-loops on the diagonal, cached
+        until _invalidate().
+        """
+        if self._matrix_cache is None:
+            nodes, node_idx, rows, cols, edge_signs = self._edge_arrays()
+            n = len(nodes)
             
-            if sign == 1 and not same_partition:
-                # Positive edge crosses partition
-                frustrated += 1
-            elif sign == -1 and same_partition:
-                # Negative edge within same partition
-                frustrated += 1
+            signs = edge_signs.astype(np.float64)
+            off_diag = rows != cols
+            A = sparse.coo_matrix(
+                (
+                    np.concatenate([signs, signs[off_diag]]),
+                    (np.concatenate([rows, cols[off_diag]]),
+                     np.concatenate([cols, rows[off_diag]]))
+                ),
+                shape=(n, n)
+            ).tocsr()
+            self._matrix_cache = (nodes, node_idx, A)
+        
+        return self._matrix_cache
+    
+    def _signed_partition(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Spectral bipartition of the signed network.
         
-        return frustrated
+        Returns (partition_mask, fiedler). The result is cached until
+        _invalidate(), so the frustration index, frustrated edges and
+        cluster assignment share a single eigendecomposition.
+        """
+        if self._spectral_cache is None:
+            nodes, _, rows, cols, edge_signs = self._edge_arrays()
+            n = len(nodes)
+            
+            # Signed Laplacian: L = D - A where D_ii = sum(|A_ij|)
+            # Find Fiedler vector (eigenvector of second smallest eigenvalue)
+            if n < 2:
+                fiedler = np.zeros(n)
+            elif n <= _DENSE_EIGEN_MAX_NODES:
+                # Small graphs go straight from the edge arrays to a dense matrix
+                A = np.zeros((n, n))
+                off_diag = rows != cols
+                np.add.at(A, (rows, cols), edge_signs)
+                np.add.at(A, (cols[off_diag], rows[off_diag]), edge_signs[off_diag])
+                L = np.diag(np.abs(A).sum(axis=1)) - A
+                eigenvalues, eigenvectors = np.linalg.eigh(L)
+                fiedler = eigenvectors[:, 1]
+            else:
+                _, _, A = self._build_signed_matrices()
+                D = sparse.diags(np.asarray(abs(A).sum(axis=1)).ravel())
+                L = (D - A).tocsr()
+                eigenvalues, eigenvectors = eigsh(
+                    L, k=2, sigma=_FIEDLER_SHIFT, which='LM'
+                )
+                fiedler = eigenvectors[:, np.argsort(eigenvalues)[1]]
+            
+            # Use sign of Fiedler vector for partition
+            partition_mask = fiedler >= 0
+            self._spectral_cache = (partition_mask, fiedler)
+        
+        return self._spectral_cache
     
     def _compute_frustration_approximate(self) -> int:
         """
@@ -124,70 +270,32 @@ class SignedNetworkAnalyzer:
         
         Uses the signed Laplacian to find an approximate optimal partition.
         """
-        nodes = list(self.graph.nodes())
-        n = len(nodes)
-        node_idx = {node: i for i, node in enumerate(nodes)}
-        
-        # Build signed adjacency matrix
-        A = np.zeros((n, n))
-        for u, v, data in self.graph.edges(data=True):
-            i, j = node_idx[u], node_idx[v]
-            A[i, j] = data['sign']
-            A[j, i] = data['sign']
-        
-        # Signed Laplacian: L = D - A where D_ii = sum(|A_ij|)
-        D = np.diag(np.abs(A).sum(axis=1))
-        L = D - A
-        
-        # Find Fiedler vector (eigenvector of second smallest eigenvalue)
-        eigenvalues, eigenvectors = np.linalg.eigh(L)
-        
-        # Use sign of Fiedler vector for partition
-        fiedler = eigenvectors[:, 1]
-        partition = set(nodes[i] for i in range(n) if fiedler[i] >= 0)
-        
-        return self._count_frustrated_edges(partition)
+        partition_mask = self._signed_partition()[0]
+        return self._count_frustrated_edges(partition_mask)
     
     def analyze_triangles(self) -> TriangleAnalysis:
         """
-        Analyze structural balance through triangle enumeration.
+        Analyze structural balance through triangle counting.
         
         A triangle is balanced if it has 0 or 2 negative edges.
         A triangle is frustrated if it has 1 or 3 negative edges.
-        """
-        triangles = []
         
-        for node in self.graph.nodes():
-            neighbors = list(self.graph.neighbors(node))
-            for i, n1 in enumerate(neighbors):
-                for n2 in neighbors[i+1:]:
-                    if self.graph.has_edge(n1, n2):
-                        # Found a triangle
-                        edges_signs = [
-                            self.graph[node][n1]['sign'],
-                            self.graph[node][n2]['sign'],
-                            self.graph[n1][n2]['sign']
-                        ]
-                        triangles.append(edges_signs)
-        
-        # Each triangle counted 3 times (once per vertex)
-        total = len(triangles) // 3
+        Each triangle i < j < k is counted exactly once from the strict
+        upper triangle U of the signed adjacency: sum((|U| @ |U|) * |U|) is
+        the number of triangles and sum((U @ U) * U) is balanced minus
+        frustrated, since a triangle's sign product is +1 exactly when it
+        is balanced.
+        """
+        _, _, A = self._build_signed_matrices()
         
-        frustrated_count = 0
-        for signs in triangles:
-            neg_count = sum(1 for s in signs if s == -1)
-            if neg_count in (1, 3):
-                frustrated_count += 1
+        # Strict upper triangle: canonical orientation, self-loops dropped
+        U = sparse.triu(A.astype(np.int64), k=1, format='csr')
+        U_abs = abs(U)
         
-        frustrated = frustrated_count // 3
-        balanced = total - frustrated
+        total = int((U_abs @ U_abs).multiply(U_abs).sum())
+        signed_sum = int((U @ U).multiply(U).sum())
         
-        return TriangleAnalysis(
-            total_triangles=total,
-            balanced_triangles=balanced,
-            frustrated_triangles=frustrated,
-            balance_ratio=balanced / total if total > 0 else 1.0
-        )
+        return triangle_analysis_from_counts(total, (total + signed_sum) // 2)
     
     def find_frustrated_edges(self) -> List[Tuple[str, str]]:
         """
@@ -196,34 +304,12 @@ class SignedNetworkAnalyzer:
         Returns the edges that, if removed or flipped, would
         improve structural balance.
         """
-        nodes = list(self.graph.nodes())
-        n = len(nodes)
-        node_idx = {node: i for i, node in enumerate(nodes)}
-        
         # Use spectral partition
-        A = np.zeros((n, n))
-        for u, v, data in self.graph.edges(data=True):
-            i, j = node_idx[u], node_idx[v]
-            A[i, j] = data['sign']
-            A[j, i] = data['sign']
-        
-        D = np.diag(np.abs(A).sum(axis=1))
-        L = D - A
+        partition_mask = self._signed_partition()[0]
+        nodes, _, edges_u, edges_v, _ = self._edge_arrays()
         
-        eigenvalues, eigenvectors = np.linalg.eigh(L)
-        fiedler = eigenvectors[:, 1]
-        
-        partition = set(nodes[i] for i in range(n) if fiedler[i] >= 0)
-        
-        frustrated_edges = []
-        for u, v, data in self.graph.edges(data=True):
-            sign = data['sign']
-            same_partition = (u in partition) == (v in partition)
-            
-            if (sign == 1 and not same_partition) or (sign == -1 and same_partition):
-                frustrated_edges.append((u, v))
-        
-        return frustrated_edges
+        frustrated = np.flatnonzero(self._frustrated_edge_mask(partition_mask))
+        return [(nodes[edges_u[k]], nodes[edges_v[k]]) for k in frustrated]
     
     def compute_structural_balance(self) -> StructuralBalanceResult:
         """
@@ -236,8 +322,9 @@ class SignedNetworkAnalyzer:
         frustrated_edges = self.find_frustrated_edges()
         triangle_analysis = self.analyze_triangles()
         
-        # Find positive and negative clusters using spectral clustering
-        nodes = list(self.graph.nodes())
+        # Find positive and negative clusters using spectral clustering;
+        # nodes are in the order the Fiedler vector was computed in
+        nodes = self._edge_arrays()[0]
         n = len(nodes)
         
         if n == 0:
@@ -250,19 +337,7 @@ class SignedNetworkAnalyzer:
                 negative_clusters=[]
             )
         
-        node_idx = {node: i for i, node in enumerate(nodes)}
-        
-        A = np.zeros((n, n))
-        for u, v, data in self.graph.edges(data=True):
-            i, j = node_idx[u], node_idx[v]
-            A[i, j] = data['sign']
-            A[j, i] = data['sign']
-        
-        D = np.diag(np.abs(A).sum(axis=1))
-        L = D - A
-        
-        eigenvalues, eigenvectors = np.linalg.eigh(L)
-        fiedler = eigenvectors[:, 1]
+        fiedler = self._signed_partition()[1]
         
         positive_cluster = {nodes[i] for i in range(n) if fiedler[i] >= 0}
         negative_cluster = {nodes[i] for i in range(n) if fiedler[i] < 0}
@@ -277,6 +352,21 @@ class SignedNetworkAnalyzer:
         )
 
 
+def triangle_analysis_from_counts(total: int, balanced: int) -> TriangleAnalysis:
+    """
+    TriangleAnalysis from the number of triangles and how many are balanced.
+    
+    Shared by SignedNetworkAnalyzer and callers that count triangles
+    elsewhere, e.g. in the database.
+    """
+    return TriangleAnalysis(
+        total_triangles=total,
+        balanced_triangles=balanced,
+        frustrated_triangles=total - balanced,
+        balance_ratio=balanced / total if total > 0 else 1.0
+    )
+
+
 def create_signed_graph_from_edges(
     edges: List[Dict]
 ) -> nx.Graph:
@@ -287,19 +377,34 @@ def create_signed_graph_from_edges(
            where sign is 'POSITIVE', 'NEGATIVE', or 1/-1
     """
     G = nx.Graph()
+    G.add_edges_from(_signed_edge_tuples(edges))
+    return G
+
+
+def _signed_edge_tuples(edges: List[Dict]) -> Iterator[Tuple[str, str, Dict]]:
+    """
+    (source, target, attributes) for add_edges_from, in a single pass.
     
+    Each row's attributes are a C-level copy of the row with the
+    endpoints popped and the sign normalized, so no per-edge filtering
+    comprehension runs; int signs are stored as they are. A row without
+    a 'sign' key is positive, but a null sign is a ValueError.
+    """
     for edge in edges:
-        sign_value = edge.get('sign', 'POSITIVE')
-        if isinstance(sign_value, str):
-            sign = 1 if sign_value == 'POSITIVE' else -1
-        else:
-            sign = int(sign_value)
-        
-        G.add_edge(
-            edge['source'],
-            edge['target'],
-            sign=sign,
-            **{k: v for k, v in edge.items() if k not in ('source', 'target', 'sign')}
-        )
-    
-    return G
+        attrs = dict(edge)
+        source = attrs.pop('source')
+        target = attrs.pop('target')
+        sign = attrs.get('sign', 'POSITIVE')
+        if type(sign) is not int:
+            if sign is None:
+                raise ValueError(f"Edge ({source}, {target}) has a null 'sign'")
+            sign = _edge_sign(sign)
+        attrs['sign'] = sign
+        yield source, target, attrs
+
+
+def _edge_sign(sign_value) -> int:
+    """Map a 'POSITIVE'/'NEGATIVE' label or numeric sign to 1/-1."""
+    if isinstance(sign_value, str):
+        return 1 if sign_value == 'POSITIVE' else -1
+    return int(sign_value)
@@ -5,12 +5,68 @@ Implements centrality measures for multiplex networks as described
 in multilayer network theory literature.
 """
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 import networkx as nx
 import numpy as np
 from scipy import sparse
-from scipy.sparse.linalg import eigs
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import ArpackNoConvergence, LinearOperator, eigs, eigsh
+
+try:
+    import igraph
+except ImportError:  # igraph is optional; layer centralities then use networkx
+    igraph = None
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; PageRank then uses scipy mat-vecs
+    _HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Supra-graphs up to this size solve the PageRank eigenproblem densely;
+# ARPACK needs at least three states and only pays off on larger ones
+_DENSE_EIGEN_MAX_SIZE = 128
+
+
+@njit(cache=True, fastmath=True)
+def _google_matvec(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    dangling: np.ndarray,
+    x: np.ndarray,
+    damping: float
+) -> np.ndarray:
+    """
+    Fused Google-matrix product: damping * (P^T x + u d^T x) + (1 - damping) * u 1^T x.
+    
+    (indptr, indices, data) is P^T in CSR form, u is uniform and d marks
+    dangling states.
+    """
+    n = indptr.shape[0] - 1
+    total = 0.0
+    leaked = 0.0
+    for i in range(n):
+        total += x[i]
+        if dangling[i]:
+            leaked += x[i]
+    base = (damping * leaked + (1.0 - damping) * total) / n
+    
+    out = np.empty(n)
+    for i in range(n):
+        acc = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            acc += data[k] * x[indices[k]]
+        out[i] = damping * acc + base
+    return out
 
 
 @dataclass
@@ -46,45 +102,177 @@ class MultiplexCentralityAnalyzer:
     Reference: Multiplex network literature (PMC)
     """
     
-    def __init__(self, layers: Dict[str, nx.Graph]):
+    def __init__(
+        self,
+        layers: Dict[str, nx.Graph],
+        betweenness_k: Optional[int] = None
+    ):
         """
         Initialize with a dictionary of layer name -> NetworkX graph.
         
         All layers should share the same node set (or subsets thereof).
+        betweenness_k enables sampled betweenness (see
+        compute_layer_centralities).
         """
         self.layers = layers
-        self.all_nodes = self._get_all_nodes()
+        self.betweenness_k = betweenness_k
+        self._layer_csr: Dict[str, sparse.csr_matrix] = {}
+        self._degree_table: Optional[np.ndarray] = None
+        self._layer_node_sets: Dict[str, frozenset] = {
+            name: frozenset(G.nodes()) for name, G in layers.items()
+        }
+        self._layer_sizes: Dict[str, int] = {
+            name: G.number_of_nodes() for name, G in layers.items()
+        }
+        self._layer_count_per_node: Counter = Counter()
+        for layer_nodes in self._layer_node_sets.values():
+            self._layer_count_per_node.update(layer_nodes)
+        self.all_nodes: FrozenSet[str] = frozenset(self._get_all_nodes())
+        self._sorted_nodes: Tuple[str, ...] = tuple(sorted(self.all_nodes))
+        self._node_idx: Dict[str, int] = {
+            node: i for i, node in enumerate(self._sorted_nodes)
+        }
     
     def _get_all_nodes(self) -> Set[str]:
         """Get union of all nodes across layers."""
         nodes: Set[str] = set()
-        for graph in self.layers.values():
-            nodes.update(graph.nodes())
+        for layer_nodes in self._layer_node_sets.values():
+            nodes.update(layer_nodes)
         return nodes
     
+    def _layer_adjacency(self, layer_name: str) -> sparse.csr_matrix:
+        """
+        Adjacency matrix of one layer over the sorted multiplex node set.
+        
+        Built once per layer and cached. Entries count parallel edges and
+        a self-loop sits once on the diagonal, as in
+        nx.to_scipy_sparse_array.
+        """
+        A = self._layer_csr.get(layer_name)
+        if A is not None:
+            return A
+        
+        G = self.layers[layer_name]
+        n = len(self._sorted_nodes)
+        edge_idx = np.fromiter(
+            (self._node_idx[node] for edge in G.edges() for node in edge),
+            dtype=np.int64, count=2 * G.number_of_edges()
+        ).reshape(-1, 2)
+        u, v = edge_idx[:, 0], edge_idx[:, 1]
+        if not G.is_directed():
+            off_diag = u != v
+            u, v = np.concatenate([u, v[off_diag]]), np.concatenate([v, u[off_diag]])
+        
+        A = sparse.coo_matrix(
+            (np.ones(len(u), dtype=np.float32), (u, v)),
+            shape=(n, n)
+        ).tocsr()
+        self._layer_csr[layer_name] = A
+        return A
+    
+    def _layer_degree_matrix(
+        self,
+        dtype: type = np.float64
+    ) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Degrees as a (N, L) matrix of the given dtype over sorted nodes
+        and layers.
+        
+        Read off the cached layer adjacencies: row sums plus column sums
+        for directed layers, plus the diagonal (self-loops count twice)
+        for undirected ones. Nodes absent from a layer have degree 0.
+        """
+        nodes = self._sorted_nodes
+        degrees = np.zeros((len(nodes), len(self.layers)), dtype=dtype)
+        
+        for layer_idx, (name, G) in enumerate(self.layers.items()):
+            A = self._layer_adjacency(name)
+            extra = A.sum(axis=0) if G.is_directed() else A.diagonal()
+            degrees[:, layer_idx] = np.ravel(A.sum(axis=1)) + np.ravel(extra)
+        
+        return nodes, degrees
+    
+    def _layer_degree_table(self) -> np.ndarray:
+        """
+        The float64 (N, L) degree matrix, built once so per-node queries
+        index a row instead of calling G.degree.
+        """
+        if self._degree_table is None:
+            _, self._degree_table = self._layer_degree_matrix()
+        return self._degree_table
+    
+    def _node_layer_degrees(self, node: str) -> np.ndarray:
+        """Degree of a node in each layer (0 where absent)."""
+        if node not in self._node_idx:
+            return np.zeros(len(self.layers))
+        return self._layer_degree_table()[self._node_idx[node]]
+    
+    def _degree_centrality_matrix(
+        self,
+        dtype: type = np.float64
+    ) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Degree centrality as a (N, L) matrix of the given dtype over
+        sorted nodes and layers.
+        
+        Nodes absent from a layer score 0 in that column; the lone node of
+        a single-node layer scores 1, as in nx.degree_centrality.
+        """
+        nodes, matrix = self._layer_degree_matrix(dtype)
+        
+        for layer_idx, name in enumerate(self.layers):
+            size = self._layer_sizes[name]
+            if size > 1:
+                matrix[:, layer_idx] /= size - 1
+            elif size == 1:
+                (node,) = self._layer_node_sets[name]
+                matrix[self._node_idx[node], layer_idx] = 1.0
+        
+        return nodes, matrix
+    
     def compute_layer_centralities(self, layer_name: str) -> LayerCentralities:
         """
         Compute all standard centrality measures for a single layer.
+        
+        Betweenness is exact (Brandes, O(nm)) unless betweenness_k is set
+        below the layer size, in which case it is estimated from k sampled
+        sources (Brandes-Pich, O(km)). The estimate is unbiased but its
+        variance grows as k shrinks; a fixed seed keeps it reproducible.
         """
         if layer_name not in self.layers:
             raise ValueError(f"Layer '{layer_name}' not found")
         
         G = self.layers[layer_name]
         
+        if (
+            igraph is not None and G.number_of_nodes() > 0
+            and not G.is_directed() and not G.is_multigraph()
+        ):
+            return self._igraph_layer_centralities(G)
+        
         # Degree centrality
         degree = nx.degree_centrality(G)
         
         # Betweenness centrality
-        betweenness = nx.betweenness_centrality(G)
+        betweenness = self._sampled_betweenness(G)
+        if betweenness is None:
+            betweenness = nx.betweenness_centrality(G)
         
         # Closeness centrality
         closeness = nx.closeness_centrality(G)
         
         # Eigenvector centrality
-        try:
-            eigenvector = nx.eigenvector_centrality(G, max_iter=1000)
-        except (nx.NetworkXError, nx.PowerIterationFailedConvergence):
-            eigenvector = {n: 0.0 for n in G.nodes()}
+        eigenvector = None
+        if (
+            not G.is_directed() and not G.is_multigraph()
+            and G.number_of_nodes() > _DENSE_EIGEN_MAX_SIZE
+        ):
+            eigenvector = self._arpack_eigenvector(layer_name)
+        if eigenvector is None:
+            try:
+                eigenvector = nx.eigenvector_centrality(G, max_iter=1000)
+            except (nx.NetworkXError, nx.PowerIterationFailedConvergence):
+                eigenvector = {n: 0.0 for n in G.nodes()}
         
         # PageRank
         try:
@@ -100,15 +288,133 @@ class MultiplexCentralityAnalyzer:
             pagerank=pagerank
         )
     
+    def compute_all_layer_centralities(
+        self,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, LayerCentralities]:
+        """
+        compute_layer_centralities for every layer, keyed by layer name.
+        
+        Layers are independent, so with max_workers > 1 they are spread
+        over a process pool of that size. The pool is opt-in: betweenness
+        and closeness are superlinear and worth shipping to a worker, but
+        for small layers pickling the graph costs more than the work.
+        """
+        if not max_workers or max_workers < 2 or len(self.layers) < 2:
+            return {name: self.compute_layer_centralities(name) for name in self.layers}
+        
+        tasks = [(name, G, self.betweenness_k) for name, G in self.layers.items()]
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as ex:
+            return dict(zip(self.layers, ex.map(_layer_centralities, tasks)))
+    
+    def _arpack_eigenvector(self, layer_name: str) -> Optional[Dict[str, float]]:
+        """
+        Eigenvector centrality of an undirected simple layer from eigsh.
+        
+        Each connected component of the cached layer adjacency is solved
+        on its own (densely when small, with ARPACK otherwise) and the
+        Perron vectors are combined as networkx's power iteration would.
+        Returns None if ARPACK does not converge.
+        """
+        layer_nodes = list(self.layers[layer_name])
+        present = np.fromiter(
+            (self._node_idx[node] for node in layer_nodes), dtype=np.int64, count=len(layer_nodes)
+        )
+        A = self._layer_adjacency(layer_name)[present][:, present].astype(np.float64)
+        
+        # Permute so that every component is a contiguous diagonal block
+        _, labels = connected_components(A, directed=False)
+        order = np.argsort(labels, kind='stable')
+        bounds = np.flatnonzero(np.diff(labels[order])) + 1
+        A = A[order][:, order].tocsr()
+        
+        parts = []
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(order)]):
+            block = A[lo:hi, lo:hi]
+            if block.nnz == 0:
+                vector, eigenvalue = np.ones(hi - lo), 0.0
+            elif hi - lo <= _DENSE_EIGEN_MAX_SIZE:
+                eigenvalues, eigenvectors = np.linalg.eigh(block.toarray())
+                vector, eigenvalue = eigenvectors[:, -1], eigenvalues[-1]
+            else:
+                try:
+                    eigenvalues, eigenvectors = eigsh(block, k=1, which='LA')
+                except ArpackNoConvergence:
+                    return None
+                vector, eigenvalue = eigenvectors[:, 0], eigenvalues[0]
+            parts.append((order[lo:hi], np.abs(vector), eigenvalue))
+        
+        vector = _combine_perron_vectors(parts, len(layer_nodes))
+        return dict(zip(layer_nodes, vector.tolist()))
+    
+    def _sampled_betweenness(self, G: nx.Graph) -> Optional[Dict[str, float]]:
+        """k-source betweenness estimate, or None when exact is requested."""
+        if self.betweenness_k is None or self.betweenness_k >= len(G):
+            return None
+        return nx.betweenness_centrality(
+            G, k=self.betweenness_k, normalized=True, seed=42
+        )
+    
+    def _igraph_layer_centralities(self, G: nx.Graph) -> LayerCentralities:
+        """
+        Layer centralities from igraph's C routines, scaled to match networkx.
+        
+        Each undirected edge becomes a pair of arcs (a self-loop a single
+        arc), which is the graph networkx itself walks for PageRank and
+        eigenvector centrality.
+        """
+        nodes, g = _to_igraph(G)
+        n = len(nodes)
+        
+        # Degree centrality
+        degree = nx.degree_centrality(G)
+        
+        # Betweenness centrality: arcs count every unordered pair twice,
+        # as networkx does before normalizing by (n-1)(n-2)
+        sampled = self._sampled_betweenness(G)
+        if sampled is not None:
+            betweenness = np.array([sampled[node] for node in nodes])
+        else:
+            betweenness = np.asarray(g.betweenness(), dtype=np.float64)
+            betweenness = betweenness / ((n - 1) * (n - 2)) if n > 2 else np.zeros(n)
+        
+        # Closeness centrality: igraph averages over reachable nodes only,
+        # networkx also applies the Wasserman-Faust (reachable - 1)/(n - 1) factor
+        components = g.connected_components(mode='weak')
+        reachable = np.asarray(components.sizes())[components.membership]
+        closeness = np.nan_to_num(np.asarray(g.closeness(mode='out'), dtype=np.float64))
+        closeness = closeness * (reachable - 1) / (n - 1) if n > 1 else np.zeros(n)
+        
+        # Eigenvector centrality, solved per component
+        parts = []
+        for members in components:
+            sub = g.induced_subgraph(members)
+            if sub.ecount() == 0:
+                vector, eigenvalue = np.ones(len(members)), 0.0
+            else:
+                vector, eigenvalue = sub.eigenvector_centrality(
+                    directed=True, scale=False, return_eigenvalue=True
+                )
+            parts.append((members, np.asarray(vector, dtype=np.float64), eigenvalue))
+        eigenvector = _combine_perron_vectors(parts, n)
+        
+        # PageRank
+        pagerank = g.pagerank(damping=0.85, weights='weight')
+        
+        return LayerCentralities(
+            degree=degree,
+            betweenness=dict(zip(nodes, betweenness.tolist())),
+            closeness=dict(zip(nodes, closeness.tolist())),
+            eigenvector=dict(zip(nodes, eigenvector.tolist())),
+            pagerank=dict(zip(nodes, pagerank))
+        )
+    
     def compute_versatility(self, node: str) -> float:
         """
         Compute node versatility - the fraction of layers
         in which the node participates.
         """
-        participating_layers = sum(
-            1 for G in self.layers.values() if node in G.nodes()
-        )
-        return participating_layers / len(self.layers)
+        return self._layer_count_per_node.get(node, 0) / len(self.layers)
     
     def compute_participation_coefficient(self, node: str) -> float:
         """
@@ -118,25 +424,16 @@ class MultiplexCentralityAnalyzer:
         P = 1 means perfectly even distribution across all layers.
         P = 0 means all edges in a single layer.
         """
-        layer_degrees = []
-        
-        for G in self.layers.values():
-            if node in G.nodes():
-                layer_degrees.append(G.degree(node))
-            else:
-                layer_degrees.append(0)
-        
-        total_degree = sum(layer_degrees)
-        if total_degree == 0:
-            return 0.0
-        
-        L = len(self.layers)
-        sum_squared = sum((d / total_degree) ** 2 for d in layer_degrees)
-        
-        # Participation coefficient formula
-        P = (L / (L - 1)) * (1 - sum_squared) if L > 1 else 0.0
-        
-        return max(0.0, min(1.0, P))
+        layer_degrees = self._node_layer_degrees(node)[np.newaxis, :]
+        return float(_participation_coefficients(layer_degrees)[0])
+    
+    def compute_all_participation_coefficients(self) -> Dict[str, float]:
+        """
+        Compute the participation coefficient of every node at once
+        from an (N, L) matrix of per-layer degrees.
+        """
+        layer_degrees = self._layer_degree_table()
+        return dict(zip(self._sorted_nodes, _participation_coefficients(layer_degrees).tolist()))
     
     def compute_multiplex_centrality(
         self,
@@ -159,35 +456,30 @@ class MultiplexCentralityAnalyzer:
         weights = {k: v / total_weight for k, v in weights.items()}
         
         centralities: Dict[str, float] = {node: 0.0 for node in self.all_nodes}
+        if not centralities:
+            return centralities
+        
+        nodes, matrix = self._degree_centrality_matrix()
+        
+        # Single-node layers contribute nothing to the max and harmonic forms
+        multi_node = np.array([self._layer_sizes[name] > 1 for name in self.layers])
         
         if method == "aggregate":
-            for layer_name, G in self.layers.items():
-                layer_centrality = nx.degree_centrality(G)
-                for node, cent in layer_centrality.items():
-                    centralities[node] += weights.get(layer_name, 0) * cent
+            layer_weights = np.array([weights.get(name, 0) for name in self.layers])
+            centralities = dict(zip(nodes, (matrix @ layer_weights).tolist()))
         
         elif method == "max":
-            for node in self.all_nodes:
-                max_cent = 0.0
-                for G in self.layers.values():
-                    if node in G.nodes():
-                        cent = G.degree(node) / (len(G.nodes()) - 1) if len(G.nodes()) > 1 else 0
-                        max_cent = max(max_cent, cent)
-                centralities[node] = max_cent
+            centralities = dict(zip(nodes, (matrix * multi_node).max(axis=1).tolist()))
         
         elif method == "harmonic":
-            for node in self.all_nodes:
-                layer_cents = []
-                for G in self.layers.values():
-                    if node in G.nodes() and len(G.nodes()) > 1:
-                        cent = G.degree(node) / (len(G.nodes()) - 1)
-                        if cent > 0:
-                            layer_cents.append(cent)
-                
-                if layer_cents:
-                    centralities[node] = len(layer_cents) / sum(1 / c for c in layer_cents)
-                else:
-                    centralities[node] = 0.0
+            present = (matrix > 0) & multi_node
+            counts = present.sum(axis=1)
+            inverse_sum = np.divide(1.0, matrix, out=np.zeros_like(matrix), where=present).sum(axis=1)
+            harmonic = np.divide(
+                counts, inverse_sum,
+                out=np.zeros(len(nodes)), where=counts > 0
+            )
+            centralities = dict(zip(nodes, harmonic.tolist()))
         
         return centralities
     
@@ -204,62 +496,93 @@ class MultiplexCentralityAnalyzer:
         Extends standard PageRank to handle multiple layers with
         inter-layer transitions.
         """
-        nodes = sorted(self.all_nodes)
+        nodes = self._sorted_nodes
         n = len(nodes)
         L = len(self.layers)
         
         if n == 0:
             return {}
         
-        node_idx = {node: i for i, node in enumerate(nodes)}
+        node_idx = self._node_idx
         
         # Build supra-adjacency matrix
         # Dimension: (n * L) x (n * L)
         supra_size = n * L
-        supra_A = sparse.lil_matrix((supra_size, supra_size))
+        blocks: List[sparse.csr_matrix] = []
+        presence = np.zeros(supra_size, dtype=np.float64)
         
         for layer_idx, (layer_name, G) in enumerate(self.layers.items()):
             offset = layer_idx * n
             
-            # Intra-layer edges
-            for u, v in G.edges():
-                if u in node_idx and v in node_idx:
-                    i = offset + node_idx[u]
-                    j = offset + node_idx[v]
-                    supra_A[i, j] = 1
-                    supra_A[j, i] = 1
+            # Intra-layer edges: the cached layer adjacency, symmetrized
+            # and binary (edges are walked both ways, parallel edges once)
+            A = self._layer_adjacency(layer_name)
+            if G.is_directed():
+                A = A + A.T
+            blocks.append((A != 0).astype(np.float64))
             
-            # Inter-layer edges (connect same node across layers)
-            for other_idx in range(L):
-                if other_idx != layer_idx:
-                    other_offset = other_idx * n
-                    for node in nodes:
-                        if node in G.nodes():
-                            i = offset + node_idx[node]
-                            j = other_offset + node_idx[node]
-                            supra_A[i, j] = inter_layer_weight
+            present = np.fromiter(
+                (node_idx[node] for node in G.nodes()),
+                dtype=np.int64, count=self._layer_sizes[layer_name]
+            )
+            presence[offset + present] = 1.0
+        
+        # Layers are disjoint blocks along the supra-diagonal
+        intra = sparse.block_diag(blocks, format='csr')
+        
+        # Inter-layer edges connect each node to its copies in every other
+        # layer: (J_L - I_L) (x) I_n, keeping rows of layers the node is in
+        coupling = inter_layer_weight * (np.ones((L, L)) - np.eye(L))
+        inter = sparse.diags(presence) @ sparse.kron(coupling, sparse.eye(n), format='csr')
         
         # Convert to CSR for efficient computation
-        supra_A = supra_A.tocsr()
+        supra_A = (intra + inter).tocsr()
         
         # Normalize rows to create transition matrix
         row_sums = np.array(supra_A.sum(axis=1)).flatten()
-        row_sums[row_sums == 0] = 1  # Avoid division by zero
+        dangling = row_sums == 0
+        row_sums[dangling] = 1  # Avoid division by zero
         
         # Create diagonal matrix of inverse row sums
         D_inv = sparse.diags(1.0 / row_sums)
-        P = D_inv @ supra_A
+        P_T = (D_inv @ supra_A).T.tocsr()
         
-        # Power iteration for PageRank
-        pr = np.ones(supra_size) / supra_size
+        # PageRank is the dominant eigenvector of the Google matrix
+        # M = damping * (P^T + u d^T) + (1 - damping) * u 1^T, where u is
+        # uniform and d marks dangling states, whose mass is spread evenly
+        uniform = 1.0 / supra_size
         
-        for _ in range(max_iter):
-            pr_new = damping * (P.T @ pr) + (1 - damping) / supra_size
-            
-            if np.linalg.norm(pr_new - pr, 1) < tol:
-                break
+        if supra_size <= _DENSE_EIGEN_MAX_SIZE:
+            M = damping * (P_T.toarray() + uniform * dangling) + (1 - damping) * uniform
+            eigenvalues, eigenvectors = np.linalg.eig(M)
+            pr = eigenvectors[:, np.argmax(eigenvalues.real)]
+        else:
+            # Apply M implicitly so ARPACK only needs sparse mat-vecs
+            def matvec(x: np.ndarray) -> np.ndarray:
+                x = np.ravel(x)
+                if _HAVE_NUMBA:
+                    return _google_matvec(
+                        P_T.indptr, P_T.indices, P_T.data, dangling,
+                        np.ascontiguousarray(x, dtype=np.float64), damping
+                    )
+                return (
+                    damping * (P_T @ x + uniform * x[dangling].sum())
+                    + (1 - damping) * uniform * x.sum()
+                )
             
-            pr = pr_new
+            M = LinearOperator((supra_size, supra_size), matvec=matvec, dtype=np.float64)
+            try:
+                _, eigenvectors = eigs(
+                    M, k=1, which='LM', tol=tol, maxiter=max_iter,
+                    v0=np.full(supra_size, uniform)
+                )
+                pr = eigenvectors[:, 0]
+            except ArpackNoConvergence as err:
+                if err.eigenvectors.size == 0:
+                    raise
+                pr = err.eigenvectors[:, 0]
+        
+        pr = np.abs(pr.real)
         
         # Aggregate PageRank across layers
         result: Dict[str, float] = {node: 0.0 for node in nodes}
@@ -279,37 +602,22 @@ class MultiplexCentralityAnalyzer:
         """
         Comprehensive centrality analysis for a single node.
         """
-        layer_centralities: Dict[str, float] = {}
-        
-        for layer_name, G in self.layers.items():
-            if node in G.nodes():
-                degree = G.degree(node) / (len(G.nodes()) - 1) if len(G.nodes()) > 1 else 0
-                layer_centralities[layer_name] = degree
-            else:
-                layer_centralities[layer_name] = 0.0
-        
-        aggregate = sum(layer_centralities.values()) / len(layer_centralities) if layer_centralities else 0.0
-        
-        return MultiplexCentralityResult(
-            node_id=node,
-            layer_centralities=layer_centralities,
-            aggregate_centrality=aggregate,
-            versatility=self.compute_versatility(node),
-            participation_coefficient=self.compute_participation_coefficient(node)
-        )
+        node_degrees = self._node_layer_degrees(node)
+        layer_degrees = {
+            layer_name: float(node_degrees[layer_idx])
+            for layer_idx, layer_name in enumerate(self.layers)
+            if node in self._layer_node_sets[layer_name]
+        }
+        return node_analysis_from_degrees(node, layer_degrees, self._layer_sizes)
     
     def find_versatile_nodes(self, min_layers: int = 3) -> List[str]:
         """
         Find nodes that participate in at least min_layers.
         """
-        versatile = []
-        
-        for node in self.all_nodes:
-            layers_count = sum(1 for G in self.layers.values() if node in G.nodes())
-            if layers_count >= min_layers:
-                versatile.append(node)
-        
-        return versatile
+        return [
+            node for node, layers_count in self._layer_count_per_node.items()
+            if layers_count >= min_layers
+        ]
     
     def compute_layer_correlation(self) -> np.ndarray:
         """
@@ -317,21 +625,131 @@ class MultiplexCentralityAnalyzer:
         
         Shows how similar centrality rankings are across layers.
         """
-        nodes = sorted(self.all_nodes)
         L = len(self.layers)
         
-        # Build centrality matrix: nodes x layers
-        centrality_matrix = np.zeros((len(nodes), L))
-        
-        for layer_idx, (layer_name, G) in enumerate(self.layers.items()):
-            centrality = nx.degree_centrality(G)
-            for node_idx, node in enumerate(nodes):
-                centrality_matrix[node_idx, layer_idx] = centrality.get(node, 0)
+        # Build centrality matrix: nodes x layers. Centralities lie in
+        # [0, 1], so float32 keeps ample digits at half the memory traffic
+        _, centrality_matrix = self._degree_centrality_matrix(np.float32)
         
         # Compute correlation between layers
         if centrality_matrix.shape[0] > 1:
-            correlation = np.corrcoef(centrality_matrix.T)
+            correlation = np.corrcoef(centrality_matrix.T, dtype=np.float32)
         else:
             correlation = np.eye(L)
         
         return correlation
+
+
+def node_analysis_from_degrees(
+    node: str,
+    layer_degrees: Dict[str, float],
+    layer_sizes: Dict[str, int]
+) -> MultiplexCentralityResult:
+    """
+    Single-node centrality analysis without the layer graphs.
+    
+    layer_degrees holds the node's degree in each layer it belongs to;
+    layer_sizes holds the node count of every layer in the multiplex.
+    """
+    layer_centralities: Dict[str, float] = {}
+    
+    for layer_name, size in layer_sizes.items():
+        if layer_name in layer_degrees:
+            degree = layer_degrees[layer_name] / (size - 1) if size > 1 else 0
+            layer_centralities[layer_name] = degree
+        else:
+            layer_centralities[layer_name] = 0.0
+    
+    aggregate = sum(layer_centralities.values()) / len(layer_centralities) if layer_centralities else 0.0
+    
+    degree_row = np.array(
+        [[layer_degrees.get(layer_name, 0) for layer_name in layer_sizes]],
+        dtype=np.float64
+    )
+    
+    return MultiplexCentralityResult(
+        node_id=node,
+        layer_centralities=layer_centralities,
+        aggregate_centrality=aggregate,
+        versatility=len(layer_degrees) / len(layer_sizes),
+        participation_coefficient=float(_participation_coefficients(degree_row)[0])
+    )
+
+
+def _layer_centralities(
+    task: Tuple[str, nx.Graph, Optional[int]]
+) -> LayerCentralities:
+    """
+    Centralities of one layer given as (name, graph, betweenness_k).
+    
+    Module-level so it can be pickled into a process pool.
+    """
+    name, G, betweenness_k = task
+    analyzer = MultiplexCentralityAnalyzer({name: G}, betweenness_k=betweenness_k)
+    return analyzer.compute_layer_centralities(name)
+
+
+def _participation_coefficients(layer_degrees: np.ndarray) -> np.ndarray:
+    """
+    Participation coefficient for each row of an (N, L) layer-degree matrix.
+    
+    P = L / (L - 1) * (1 - sum_l (d_l / d)^2), clipped to [0, 1]; nodes
+    without edges, and multiplexes with a single layer, score 0.
+    """
+    N, L = layer_degrees.shape
+    if L < 2:
+        return np.zeros(N)
+    
+    totals = layer_degrees.sum(axis=1, keepdims=True)
+    shares = np.divide(
+        layer_degrees, totals,
+        out=np.zeros_like(layer_degrees), where=totals > 0
+    )
+    P = (L / (L - 1)) * (1 - np.square(shares).sum(axis=1))
+    P[totals[:, 0] == 0] = 0.0
+    
+    return np.clip(P, 0.0, 1.0)
+
+
+def _combine_perron_vectors(
+    parts: List[Tuple[np.ndarray, np.ndarray, float]],
+    n: int
+) -> np.ndarray:
+    """
+    Eigenvector centrality from per-component (members, vector, eigenvalue).
+    
+    networkx's power iteration from a uniform vector converges to the
+    Perron vectors of the components with the largest eigenvalue,
+    weighted by their overlap with that start vector; the result has
+    unit Euclidean norm.
+    """
+    top = max(eigenvalue for _, _, eigenvalue in parts)
+    eigenvector = np.zeros(n)
+    for members, vector, eigenvalue in parts:
+        if np.isclose(eigenvalue, top, rtol=1e-9, atol=1e-12):
+            vector = vector / np.linalg.norm(vector)
+            eigenvector[members] = vector * vector.sum()
+    return eigenvector / np.linalg.norm(eigenvector)
+
+
+def _to_igraph(G: nx.Graph) -> Tuple[List[str], "igraph.Graph"]:
+    """
+    Convert an undirected NetworkX graph to a directed igraph graph.
+    
+    Returns (nodes, graph) where vertex i is nodes[i]. Every edge becomes
+    two opposite arcs except self-loops, which become one arc; arcs carry
+    the edge's 'weight' attribute (default 1).
+    """
+    nodes = list(G.nodes())
+    idx = {node: i for i, node in enumerate(nodes)}
+    arcs = []
+    weights = []
+    for u, v, w in G.edges(data='weight', default=1):
+        arcs.append((idx[u], idx[v]))
+        weights.append(w)
+        if u != v:
+            arcs.append((idx[v], idx[u]))
+            weights.append(w)
+    return nodes, igraph.Graph(
+        n=len(nodes), edges=arcs, directed=True, edge_attrs={'weight': weights}
+    )
@@ -4,27 +4,42 @@ Multiplex Network Analytics - FastAPI Server
 Production API for network analytics services.
 """
 
+import asyncio
+import hashlib
+import logging
+import multiprocessing
 import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Dict, List, Optional
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
+)
 
+import httpx
 import networkx as nx
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from cachetools import LRUCache, TTLCache, cached
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from neo4j import GraphDatabase
+from fastapi.middleware.gzip import GZipMiddleware
+from neo4j import AsyncGraphDatabase
+from neo4j.exceptions import ClientError
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 from prometheus_client import Counter, Histogram, generate_latest
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 from .balance.signed_network import (
     SignedNetworkAnalyzer,
     create_signed_graph_from_edges,
+    triangle_analysis_from_counts,
     StructuralBalanceResult,
     TriangleAnalysis,
 )
 from .centrality.multiplex_centrality import (
     MultiplexCentralityAnalyzer,
+    node_analysis_from_degrees,
     MultiplexCentralityResult,
 )
 from .advanced.institutional_metrics import (
@@ -46,6 +61,9 @@ class Settings(BaseSettings):
     neo4j_password: str = ""
     redis_url: str = "redis://localhost:6379"
     analytics_port: int = 8001
+    analytics_processes: Optional[int] = None
+    analytics_cache_size: int = 256
+    analytics_cache_ttl: int = 300
     log_level: str = "info"
     
     class Config:
@@ -54,6 +72,8 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Metrics
@@ -71,21 +91,99 @@ REQUEST_LATENCY = Histogram(
     ["endpoint"]
 )
 
+CACHE_HITS = Counter(
+    "analytics_cache_hits_total",
+    "Analytics responses served from a result cache",
+    ["endpoint", "tier"]
+)
+
+CACHE_MISSES = Counter(
+    "analytics_cache_misses_total",
+    "Analytics responses computed after missing every result cache",
+    ["endpoint"]
+)
+
+# Label children bound once, so request paths skip the labels() lookup
+FRUSTRATION_STARTED = REQUEST_COUNT.labels(endpoint="frustration", status="started")
+FRUSTRATION_SUCCESS = REQUEST_COUNT.labels(endpoint="frustration", status="success")
+
+# Endpoints served through _cached_analytics
+CACHED_ENDPOINTS = (
+    "frustration",
+    "triangles",
+    "centrality",
+    "pagerank",
+    "meta_stability",
+    "information_asymmetry",
+)
+MEMORY_CACHE_HITS = {e: CACHE_HITS.labels(endpoint=e, tier="memory") for e in CACHED_ENDPOINTS}
+NEO4J_CACHE_HITS = {e: CACHE_HITS.labels(endpoint=e, tier="neo4j") for e in CACHED_ENDPOINTS}
+ENDPOINT_CACHE_MISSES = {e: CACHE_MISSES.labels(endpoint=e) for e in CACHED_ENDPOINTS}
+
 
 # ============================================================================
 # Database Client
 # ============================================================================
 
+# Uniqueness constraints give every MERGE key an index lookup instead of a
+# label scan; the layer index serves the per-layer edge queries
+_SCHEMA_STATEMENTS = (
+    "CREATE CONSTRAINT bill_id IF NOT EXISTS FOR (b:Bill) REQUIRE b.id IS UNIQUE",
+    "CREATE CONSTRAINT legislator_id IF NOT EXISTS FOR (l:Legislator) REQUIRE l.id IS UNIQUE",
+    "CREATE CONSTRAINT committee_id IF NOT EXISTS FOR (c:Committee) REQUIRE c.id IS UNIQUE",
+    "CREATE CONSTRAINT institution_id IF NOT EXISTS FOR (i:Institution) REQUIRE i.id IS UNIQUE",
+    "CREATE CONSTRAINT graph_version_id IF NOT EXISTS FOR (v:GraphVersion) REQUIRE v.id IS UNIQUE",
+    "CREATE CONSTRAINT analytics_result_key IF NOT EXISTS "
+    "FOR (r:AnalyticsResult) REQUIRE (r.kind, r.key) IS UNIQUE",
+    "CREATE INDEX edge_layer IF NOT EXISTS FOR ()-[e:EDGE]-() ON (e.layer)",
+)
+
+
 class Neo4jClient:
     def __init__(self, uri: str, user: str, password: str):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        # One pooled driver for the process; sessions borrow its connections
+        self.driver = AsyncGraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=100,
+            max_connection_lifetime=3600,
+            connection_acquisition_timeout=60
+        )
     
-    def close(self):
-        self.driver.close()
+    async def close(self):
+        await self.driver.close()
     
-    def get_layer_edges(self, layer: str) -> List[Dict]:
-        with self.driver.session() as session:
-            result = session.run(
+    async def ensure_schema(self) -> None:
+        """
+        Create the constraints and indexes the queries rely on, if missing.
+        
+        Each statement is attempted on its own, so one failure (such as
+        duplicates blocking a constraint, or Neo4j being unreachable) is
+        logged without skipping the rest; queries still work unindexed.
+        """
+        async with self.driver.session() as session:
+            for statement in _SCHEMA_STATEMENTS:
+                try:
+                    result = await session.run(statement)
+                    await result.consume()
+                except Exception:
+                    logger.exception("Schema statement failed: %s", statement)
+    
+    async def ping(self, timeout: float) -> bool:
+        """Whether a trivial query round-trips within timeout seconds."""
+        async def probe() -> None:
+            async with self.driver.session() as session:
+                await session.run("RETURN 1")
+        
+        try:
+            await asyncio.wait_for(probe(), timeout)
+        except Exception:
+            return False
+        return True
+    
+    async def get_layer_edges(self, layer: str) -> List[Dict]:
+        async with self.driver.session() as session:
+            result = await session.run(
                 """
                 MATCH (s)-[e:EDGE {layer: $layer}]->(t)
                 RETURN s.id as source, t.id as target, 
@@ -93,35 +191,318 @@ class Neo4jClient:
                 """,
                 layer=layer
             )
-            return [dict(r) for r in result]
+            return await result.data()
+    
+    async def get_edges_by_layers(
+        self,
+        layers: Optional[List[str]] = None
+    ) -> Dict[Optional[str], List[Tuple[str, str]]]:
+        """
+        (source, target) pairs grouped per layer in the database.
+        
+        Only the given layers are read, through the layer index; every
+        layer when layers is None.
+        """
+        where = "WHERE e.layer IN $layers" if layers is not None else ""
+        async with self.driver.session() as session:
+            result = await session.run(
+                f"""
+                MATCH (s)-[e:EDGE]->(t)
+                {where}
+                RETURN e.layer as layer, collect([s.id, t.id]) as pairs
+                """,
+                layers=layers
+            )
+            return {r["layer"]: [tuple(pair) for pair in r["pairs"]] async for r in result}
+    
+    async def count_layer_triangles(self, layer: str) -> Optional[Tuple[int, int]]:
+        """
+        (total, balanced) signed triangles of a layer, counted in the
+        database so no edges cross the wire; None if the layer is empty.
+        
+        Like the Python analyzer, each node pair counts once whatever the
+        direction or number of its edges, and self-loops are ignored. A
+        pair with any negative edge is negative here, whereas the Python
+        fallback keeps the sign of whichever parallel edge it reads last,
+        so the two can differ on pairs joined by edges of mixed sign.
+        
+        Signs follow the Python analyzer too: 'POSITIVE' is 1, any other
+        string is -1, and numbers must be 1 or -1. A null, missing or
+        other numeric sign raises ValueError, as it does there, and no
+        triangles are counted.
+        """
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH ()-[e:EDGE {layer: $layer}]->()
+                WITH count(e) as edge_count,
+                     count(CASE WHEN e.sign IS NULL
+                                  OR NOT (e.sign IN [1, -1]
+                                          OR valueType(e.sign) STARTS WITH 'STRING')
+                                THEN 1 END) as invalid_signs
+                CALL {
+                    WITH invalid_signs
+                    MATCH (a)-[e1:EDGE {layer: $layer}]-(b)-[e2:EDGE {layer: $layer}]-(c)
+                          -[e3:EDGE {layer: $layer}]-(a)
+                    WHERE invalid_signs = 0
+                      AND elementId(a) < elementId(b) AND elementId(b) < elementId(c)
+                    WITH a, b, c,
+                         min(CASE WHEN e1.sign = 'POSITIVE' OR e1.sign = 1 THEN 1 ELSE -1 END) *
+                         min(CASE WHEN e2.sign = 'POSITIVE' OR e2.sign = 1 THEN 1 ELSE -1 END) *
+                         min(CASE WHEN e3.sign = 'POSITIVE' OR e3.sign = 1 THEN 1 ELSE -1 END) as product
+                    RETURN count(*) as total, count(CASE WHEN product > 0 THEN 1 END) as balanced
+                }
+                RETURN edge_count, invalid_signs, total, balanced
+                """,
+                layer=layer
+            )
+            record = await result.single()
+            if not record["edge_count"]:
+                return None
+            if record["invalid_signs"]:
+                raise ValueError(
+                    f"{record['invalid_signs']} edges in layer '{layer}' have a "
+                    "null or invalid sign"
+                )
+            return record["total"], record["balanced"]
     
-    def get_all_edges(self) -> List[Dict]:
-        with self.driver.session() as session:
-            result = session.run(
+    async def get_all_edges(self) -> List[Dict]:
+        async with self.driver.session() as session:
+            result = await session.run(
                 """
                 MATCH (s)-[e:EDGE]->(t)
                 RETURN s.id as source, t.id as target,
                        e.sign as sign, e.layer as layer, e.weight as weight
                 """
             )
-            return [dict(r) for r in result]
+            return await result.data()
+    
+    async def iter_all_edges(self) -> AsyncIterator[Tuple[str, str, Optional[str]]]:
+        """Stream (source, target, layer) for every edge without buffering."""
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (s)-[e:EDGE]->(t)
+                RETURN s.id as source, t.id as target, e.layer as layer
+                """
+            )
+            async for r in result:
+                yield r["source"], r["target"], r["layer"]
+    
+    async def get_node_edges(self, node_id: str) -> List[Tuple[str, str, Optional[str]]]:
+        """(source, target, layer) for the edges incident to one node."""
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (s)-[e:EDGE]->(t)
+                WHERE s.id = $node_id OR t.id = $node_id
+                RETURN s.id as source, t.id as target, e.layer as layer
+                """,
+                node_id=node_id
+            )
+            return [(r["source"], r["target"], r["layer"]) async for r in result]
+    
+    async def get_layer_sizes(self) -> Dict[Optional[str], int]:
+        """Number of distinct edge endpoints in each layer."""
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (s)-[e:EDGE]->(t)
+                UNWIND [s.id, t.id] as node
+                RETURN e.layer as layer, count(DISTINCT node) as size
+                """
+            )
+            return {r["layer"]: r["size"] async for r in result}
+    
+    async def get_graph_version(self) -> int:
+        """The ingest generation recorded in the graph; 0 before any ingest."""
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (v:GraphVersion {id: 'graph'})
+                RETURN v.version as version
+                """
+            )
+            record = await result.single()
+            return record["version"] if record else 0
+    
+    async def get_analytics_result(self, kind: str, key: str, graph_version: int) -> Optional[str]:
+        """The stored JSON result of one analytics run, if still current."""
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (r:AnalyticsResult {kind: $kind, key: $key})
+                WHERE r.graph_version = $graph_version
+                RETURN r.value as value
+                """,
+                kind=kind, key=key, graph_version=graph_version
+            )
+            record = await result.single()
+            return record["value"] if record else None
+    
+    async def put_analytics_result(self, kind: str, key: str, graph_version: int, value: str) -> None:
+        """
+        Store one analytics result, replacing any from an older version.
+        
+        Nothing is written unless graph_version is still the current one:
+        an ingest that lands while the result is computed may have changed
+        the edges it was computed from.
+        """
+        async with self.driver.session() as session:
+            await session.run(
+                """
+                OPTIONAL MATCH (v:GraphVersion {id: 'graph'})
+                WITH v WHERE coalesce(v.version, 0) = $graph_version
+                MERGE (r:AnalyticsResult {kind: $kind, key: $key})
+                SET r.graph_version = $graph_version, r.value = $value,
+                    r.computed_at = datetime()
+                """,
+                kind=kind, key=key, graph_version=graph_version, value=value
+            )
+    
+    async def merge_congress_batch(self, congress: Dict[str, Any], batch: "CongressBatch") -> int:
+        """
+        Write one Congress ingest run with UNWIND, in a single transaction.
+        
+        Returns the graph version the write bumped the graph to.
+        """
+        async with self.driver.session() as session:
+            return await session.execute_write(self._merge_congress_batch, congress, batch)
+    
+    @staticmethod
+    async def _merge_congress_batch(tx, congress: Dict[str, Any], batch: "CongressBatch") -> int:
+        await tx.run("""
+            MERGE (c:Institution {id: $id})
+            ON CREATE SET c.name = $name, c.type = 'Congress', c.congress = $congress
+        """, **congress)
+        
+        # Nodes: properties are written on creation; only a bill's latest
+        # action changes between ingests
+        await tx.run("""
+            UNWIND $rows AS row
+            MERGE (b:Bill {id: row.id})
+            ON CREATE SET b.number = row.number, b.title = row.title, b.type = row.type,
+                b.congress = row.congress, b.latestAction = row.latestAction,
+                b.actionDate = row.actionDate
+            ON MATCH SET b.latestAction = row.latestAction, b.actionDate = row.actionDate
+        """, rows=batch["bills"])
+        await tx.run("""
+            UNWIND $rows AS row
+            MERGE (l:Legislator {id: row.id})
+            ON CREATE SET l.name = row.name, l.party = row.party, l.state = row.state,
+                l.type = 'Legislator'
+        """, rows=batch["legislators"])
+        await tx.run("""
+            UNWIND $rows AS row
+            MERGE (c:Committee {id: row.id})
+            ON CREATE SET c.name = row.name, c.chamber = row.chamber, c.type = 'Committee'
+        """, rows=batch["committees"])
+        
+        # Relationships
+        await tx.run("""
+            UNWIND $rows AS row
+            MATCH (l:Legislator {id: row.legislator_id}), (b:Bill {id: row.bill_id})
+            MERGE (l)-[:SPONSORED {layer: 'Sponsorship', sign: 1}]->(b)
+        """, rows=batch["sponsored"])
+        await tx.run("""
+            UNWIND $rows AS row
+            MATCH (l:Legislator {id: row.legislator_id}), (b:Bill {id: row.bill_id})
+            MERGE (l)-[:COSPONSORED {layer: 'Sponsorship', sign: 1}]->(b)
+        """, rows=batch["cosponsored"])
+        await tx.run("""
+            UNWIND $rows AS row
+            MATCH (b:Bill {id: row.bill_id}), (c:Committee {id: row.committee_id})
+            MERGE (b)-[:REFERRED_TO {layer: 'Legislative', sign: 1}]->(c)
+        """, rows=batch["referred"])
+        await tx.run("""
+            UNWIND $rows AS row
+            MATCH (c:Committee {id: row.id}), (cong:Institution {id: $congress_id})
+            MERGE (c)-[:PART_OF {layer: 'Legislative', sign: 1}]->(cong)
+        """, rows=batch["committees"], congress_id=congress["id"])
+        
+        result = await tx.run("""
+            MERGE (v:GraphVersion {id: 'graph'})
+            SET v.version = coalesce(v.version, 0) + 1
+            RETURN v.version as version
+        """)
+        record = await result.single()
+        version = record["version"]
+        
+        # Stored results for older versions can never be served again
+        await tx.run("""
+            MATCH (r:AnalyticsResult)
+            WHERE r.graph_version < $version
+            DELETE r
+        """, version=version)
+        return version
 
 
 # Global client
 db_client: Optional[Neo4jClient] = None
 
+# Process pool for CPU-bound analytics
+process_pool: Optional[ProcessPoolExecutor] = None
+
+# Outbound HTTP client shared by every ingest, so its pool stays warm
+http_client: Optional[httpx.AsyncClient] = None
+
+# Analytics responses keyed on (endpoint, params, graph_version); ingest
+# bumps graph_version so entries from before a write are never served
+analytics_cache: TTLCache = TTLCache(
+    maxsize=settings.analytics_cache_size,
+    ttl=settings.analytics_cache_ttl
+)
+
+# The graph_version stored in Neo4j, re-read after a few seconds so an
+# ingest served by another replica retires this process's entries too
+_GRAPH_VERSION_TTL = 2.0
+graph_version_cache: TTLCache = TTLCache(maxsize=1, ttl=_GRAPH_VERSION_TTL)
+
+# The all-edges snapshot for the current graph_version, shared by every
+# endpoint that analyzes the whole multiplex; maxsize=1 drops older versions
+graph_snapshot_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.analytics_cache_ttl)
+
+# Distinct nodes per layer for the current graph_version, which every
+# single-node centrality request needs
+layer_sizes_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.analytics_cache_ttl)
+
+# Last database probe for /health, so frequent liveness checks share one
+# Bolt round trip instead of each opening a session
+_HEALTH_PROBE_TTL = 3.0
+_HEALTH_PROBE_TIMEOUT = 1.0
+health_cache: TTLCache = TTLCache(maxsize=1, ttl=_HEALTH_PROBE_TTL)
+
+# Fire-and-forget tasks such as post-ingest cache warming; held here so
+# they are not garbage collected mid-run, and cancelled on shutdown
+background_tasks: Set[asyncio.Task] = set()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global db_client
+    global db_client, process_pool, http_client
     db_client = Neo4jClient(
         settings.neo4j_uri,
         settings.neo4j_user,
         settings.neo4j_password
     )
+    await db_client.ensure_schema()
+    # Spawned rather than forked: the parent already holds driver sockets
+    process_pool = ProcessPoolExecutor(
+        max_workers=settings.analytics_processes or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=120.0
+    )
     yield
+    for task in background_tasks:
+        task.cancel()
+    await http_client.aclose()
+    process_pool.shutdown(cancel_futures=True)
     if db_client:
-        db_client.close()
+        await db_client.close()
 
 
 # ============================================================================
@@ -143,6 +524,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # ============================================================================
 # Response Models
@@ -197,22 +580,683 @@ class InformationAsymmetryResponse(BaseModel):
     information_periphery: List[str]
 
 
+# ============================================================================
+# Graph Construction
+# ============================================================================
+
+LayerEdges = Tuple[Tuple[str, str, Optional[str]], ...]
+
+
+def _build_layers_from_edges(edges: LayerEdges) -> Dict[str, nx.Graph]:
+    """Split (source, target, layer) edges into one graph per layer."""
+    buckets: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for source, target, layer in edges:
+        buckets[layer].append((source, target))
+    return {layer: nx.Graph(pairs) for layer, pairs in buckets.items()}
+
+
+def _node_layer_degrees(node_id: str, edges: LayerEdges) -> Dict[Optional[str], int]:
+    """
+    Degree of a node in each layer from its incident edges.
+    
+    Counts distinct neighbours, with a self-loop adding 2, as nx.Graph
+    does for the layers built by _build_layers_from_edges.
+    """
+    neighbours: Dict[Optional[str], set] = {}
+    self_loops: Dict[Optional[str], int] = {}
+    for source, target, layer in edges:
+        neighbours.setdefault(layer, set())
+        if source == target:
+            self_loops[layer] = 2
+        else:
+            neighbours[layer].add(target if source == node_id else source)
+    return {
+        layer: len(nodes) + self_loops.get(layer, 0)
+        for layer, nodes in neighbours.items()
+    }
+
+
+# Identifies an edge snapshot: (graph_version, layer filter or None).
+# Analyzer caches key on it, so a lookup never hashes the edges themselves
+SnapshotKey = Tuple[int, Optional[Tuple[str, ...]]]
+
+
+class _SnapshotMiss(Exception):
+    """A worker was sent a SnapshotKey without edges and has not cached it."""
+
+
+# Two entries: the current snapshot and one layer subset, or the snapshot
+# being retired while a new graph_version takes over
+@cached(LRUCache(maxsize=2), key=lambda snapshot, edges: snapshot)
+def _get_multiplex_analyzer(
+    snapshot: SnapshotKey,
+    edges: Optional[LayerEdges]
+) -> MultiplexCentralityAnalyzer:
+    """
+    Multiplex analyzer for an edge snapshot.
+    
+    Repeated requests against an unchanged database reuse the layer
+    graphs and the analyzer instead of rebuilding them; edges are only
+    needed on a miss, and _SnapshotMiss is raised if they were not sent.
+    """
+    if edges is None:
+        raise _SnapshotMiss(snapshot)
+    return MultiplexCentralityAnalyzer(_build_layers_from_edges(edges))
+
+
+@cached(LRUCache(maxsize=2), key=lambda snapshot, edges: snapshot)
+def _get_institutional_metrics(
+    snapshot: SnapshotKey,
+    edges: Optional[LayerEdges]
+) -> AdvancedInstitutionalMetrics:
+    """Institutional metrics over the directed graph of an edge snapshot."""
+    if edges is None:
+        raise _SnapshotMiss(snapshot)
+    G = nx.DiGraph((source, target) for source, target, _ in edges)
+    return AdvancedInstitutionalMetrics(G)
+
+
+# ============================================================================
+# Analytics Workers
+# ============================================================================
+# Module-level so they can be pickled into the process pool. Each worker
+# process keeps its own analyzer caches, keyed on the SnapshotKey passed in;
+# _run_snapshot_analytics only pickles the edges for a worker that misses.
+
+T = TypeVar("T")
+
+
+def _structural_balance(edges: List[Dict]) -> StructuralBalanceResult:
+    analyzer = SignedNetworkAnalyzer(create_signed_graph_from_edges(edges))
+    return analyzer.compute_structural_balance()
+
+
+def _triangle_analysis(edges: List[Dict]) -> TriangleAnalysis:
+    analyzer = SignedNetworkAnalyzer(create_signed_graph_from_edges(edges))
+    return analyzer.analyze_triangles()
+
+
+def _multiplex_centrality(
+    snapshot: SnapshotKey,
+    edges: Optional[LayerEdges],
+    method: str
+) -> Dict[str, float]:
+    return _get_multiplex_analyzer(snapshot, edges).compute_multiplex_centrality(method=method)
+
+
+def _multiplex_pagerank(
+    snapshot: SnapshotKey,
+    edges: Optional[LayerEdges],
+    inter_layer_weight: float
+) -> Dict[str, float]:
+    analyzer = _get_multiplex_analyzer(snapshot, edges)
+    return analyzer.compute_multiplex_pagerank(inter_layer_weight=inter_layer_weight)
+
+
+def _constraint_dominance(
+    snapshot: SnapshotKey,
+    edges: Optional[LayerEdges],
+    constraint_nodes: List[str]
+) -> ConstraintDominanceResult:
+    metrics = _get_institutional_metrics(snapshot, edges)
+    return metrics.analyze_constraint_dominance(constraint_nodes)
+
+
+def _meta_stability(snapshot: SnapshotKey, edges: Optional[LayerEdges]) -> float:
+    return _get_institutional_metrics(snapshot, edges).compute_meta_stability()
+
+
+def _information_asymmetry(snapshot: SnapshotKey, edges: Optional[LayerEdges]) -> InformationAsymmetryResult:
+    return _get_institutional_metrics(snapshot, edges).measure_information_asymmetry()
+
+
+def _graph_etag(endpoint: str, version: int, *params: Any) -> str:
+    """
+    Weak ETag for an endpoint's response at one graph_version.
+    
+    Weak because the gzip and identity encodings of a response share it.
+    """
+    key = repr((endpoint, version, params)).encode()
+    return f'W/"{hashlib.blake2b(key, digest_size=8).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    A 304 response if the client's If-None-Match already holds etag.
+    
+    Centrality responses carry Cache-Control: no-cache, so clients
+    revalidate on every request and only pay for headers on a match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if etag.removeprefix("W/") in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
+def _set_cache_headers(response: Response, etag: str) -> None:
+    """Tag a response and require clients to revalidate before reuse."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def _model_response(model: BaseModel) -> Response:
+    """
+    JSON response for a model built with model_construct, encoded by orjson.
+    
+    Routes returning it declare response_model=None, so the model is
+    never validated again. The response models are flat, so their field
+    values are encoded as they are, without a model_dump() copy; NaN and
+    infinities encode as null, as in pydantic's own JSON.
+    """
+    content = orjson.dumps(
+        vars(model),
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+    return Response(content, media_type="application/json")
+
+
+async def _run_analytics(func: Callable[..., T], *args: Any) -> T:
+    """Run an analytics worker off the event loop, in the process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(process_pool, func, *args)
+
+
+async def _run_snapshot_analytics(
+    func: Callable[..., T],
+    snapshot: SnapshotKey,
+    edges: LayerEdges,
+    *args: Any
+) -> T:
+    """
+    Run a snapshot worker, first with the SnapshotKey alone and with the
+    edges only if the worker it lands on has not cached that snapshot.
+    """
+    try:
+        return await _run_analytics(func, snapshot, None, *args)
+    except _SnapshotMiss:
+        return await _run_analytics(func, snapshot, edges, *args)
+
+
+async def _current_graph_version() -> int:
+    """graph_version as stored in Neo4j, at most _GRAPH_VERSION_TTL old."""
+    version = graph_version_cache.get("version")
+    if version is None:
+        version = await db_client.get_graph_version()
+        graph_version_cache["version"] = version
+    return version
+
+
+async def _cached_analytics(
+    endpoint: str,
+    params: Tuple[Any, ...],
+    compute: Callable[[], Awaitable[T]],
+    persist: bool = True
+) -> T:
+    """
+    Serve a result from analytics_cache, then from the AnalyticsResult
+    nodes in Neo4j, and only then await compute() and store it in both.
+    
+    Pass persist=False for client-chosen parameters, so they only ever
+    reach the bounded in-memory tier. The Neo4j tier is best-effort: its
+    failures are logged and the result is computed or served anyway.
+    
+    compute() must return plain JSON data; the stored copy decodes to
+    lists where compute() returned tuples.
+    """
+    version = await _current_graph_version()
+    key = (endpoint, params, version)
+    try:
+        value = analytics_cache[key]
+    except KeyError:
+        pass
+    else:
+        MEMORY_CACHE_HITS[endpoint].inc()
+        return value
+    
+    stored = None
+    if persist:
+        stored_key = orjson.dumps(params).decode()
+        try:
+            stored = await db_client.get_analytics_result(endpoint, stored_key, version)
+        except Exception:
+            logger.exception("Reading stored %s result failed", endpoint)
+    if stored is not None:
+        NEO4J_CACHE_HITS[endpoint].inc()
+        value = orjson.loads(stored)
+    else:
+        ENDPOINT_CACHE_MISSES[endpoint].inc()
+        value = await compute()
+        if persist:
+            encoded = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+            try:
+                await db_client.put_analytics_result(endpoint, stored_key, version, encoded)
+            except Exception:
+                logger.exception("Storing %s result failed", endpoint)
+    analytics_cache[key] = value
+    return value
+
+
+async def _graph_snapshot() -> LayerEdges:
+    """Every (source, target, layer) edge, read from Neo4j once per graph_version."""
+    version = await _current_graph_version()
+    edges = graph_snapshot_cache.get(version)
+    if edges is None:
+        edges = tuple([edge async for edge in db_client.iter_all_edges()])
+        graph_snapshot_cache[version] = edges
+    return edges
+
+
+async def _layer_sizes() -> Dict[Optional[str], int]:
+    """Node count of every layer, read from Neo4j once per graph_version."""
+    version = await _current_graph_version()
+    sizes = layer_sizes_cache.get(version)
+    if sizes is None:
+        sizes = await db_client.get_layer_sizes()
+        layer_sizes_cache[version] = sizes
+    return sizes
+
+
+async def _layer_edges(layers: Optional[Tuple[str, ...]]) -> Tuple[SnapshotKey, LayerEdges]:
+    """
+    (snapshot key, edges) for the given layers, or for the whole graph
+    when layers is None; a subset is filtered in Neo4j.
+    
+    The version is read before the edges, so a concurrent ingest can
+    only file newer edges under an older key, never the reverse.
+    """
+    version = await _current_graph_version()
+    if layers is None:
+        return (version, None), await _graph_snapshot()
+    grouped = await db_client.get_edges_by_layers(list(layers))
+    return (version, layers), tuple(
+        (source, target, layer)
+        for layer, pairs in grouped.items()
+        for source, target in pairs
+    )
+
+
+def _spawn_background(coro: Coroutine[Any, Any, Any]) -> None:
+    """Run coro as a background task that lives until it finishes."""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+
+# ============================================================================
+# Whole-Graph Analytics
+# ============================================================================
+# Cached results for the endpoints that analyze the whole multiplex; shared
+# by the endpoints and by cache warming.
+
+DEFAULT_CENTRALITY_METHOD = "aggregate"
+DEFAULT_INTER_LAYER_WEIGHT = 0.5
+
+
+async def _centrality_result(
+    method: str,
+    layers: Optional[Tuple[str, ...]] = None
+) -> Tuple[str, Dict[str, float]]:
+    """(etag, centralities) for the current graph, or for some of its layers."""
+    async def compute() -> Tuple[str, Dict[str, float]]:
+        snapshot, edges = await _layer_edges(layers)
+        
+        if not edges:
+            raise HTTPException(status_code=404, detail="No edges found")
+        
+        centralities = await _run_snapshot_analytics(_multiplex_centrality, snapshot, edges, method)
+        return _graph_etag("centrality", *snapshot, method), centralities
+    
+    # Layer subsets are client-chosen, so only whole-graph results persist
+    return await _cached_analytics(
+        "centrality", (method, layers), compute, persist=layers is None
+    )
+
+
+async def _pagerank_result(
+    inter_layer_weight: float,
+    layers: Optional[Tuple[str, ...]] = None
+) -> Tuple[str, Dict[str, float]]:
+    """(etag, pagerank) for the current graph, or for some of its layers."""
+    async def compute() -> Tuple[str, Dict[str, float]]:
+        snapshot, edges = await _layer_edges(layers)
+        
+        if not edges:
+            raise HTTPException(status_code=404, detail="No edges found")
+        
+        pagerank = await _run_snapshot_analytics(
+            _multiplex_pagerank, snapshot, edges, inter_layer_weight
+        )
+        return _graph_etag("pagerank", *snapshot, inter_layer_weight), pagerank
+    
+    # Only the default whole-graph PageRank persists; any other weight or
+    # layer subset is client-chosen
+    persist = layers is None and inter_layer_weight == DEFAULT_INTER_LAYER_WEIGHT
+    return await _cached_analytics(
+        "pagerank", (inter_layer_weight, layers), compute, persist=persist
+    )
+
+
+def _layer_filter(layers: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """Canonical form of a ?layers= filter, so equal filters share cache entries."""
+    return tuple(sorted(set(layers))) if layers else None
+
+
+async def _meta_stability_result() -> float:
+    """Meta-stability of the current graph."""
+    async def compute() -> float:
+        snapshot, edges = await _layer_edges(None)
+        return await _run_snapshot_analytics(_meta_stability, snapshot, edges)
+    
+    return await _cached_analytics("meta_stability", (), compute)
+
+
+async def _information_asymmetry_result() -> Dict[str, Any]:
+    """Gini coefficient and top hubs/periphery for the current graph."""
+    async def compute() -> Dict[str, Any]:
+        snapshot, edges = await _layer_edges(None)
+        result = await _run_snapshot_analytics(_information_asymmetry, snapshot, edges)
+        
+        return {
+            "gini_coefficient": result.gini_coefficient,
+            "information_hubs": result.information_hubs[:10],
+            "information_periphery": result.information_periphery[:10],
+        }
+    
+    return await _cached_analytics("information_asymmetry", (), compute)
+
+
+async def _warm_analytics() -> Dict[str, bool]:
+    """
+    Compute the whole-graph analytics at their default parameters into
+    both cache tiers, so the first reads after an ingest are lookups.
+    
+    Returns whether reading the graph snapshot and then each analytic
+    succeeded; nothing is computed if the snapshot could not be read.
+    """
+    targets = {
+        "centrality": lambda: _centrality_result(DEFAULT_CENTRALITY_METHOD),
+        "pagerank": lambda: _pagerank_result(DEFAULT_INTER_LAYER_WEIGHT),
+        "meta_stability": _meta_stability_result,
+        "information_asymmetry": _information_asymmetry_result,
+    }
+    try:
+        # Fetch the snapshot once up front rather than once per analytic
+        await _graph_snapshot()
+    except Exception:
+        logger.exception("Reading the graph snapshot to warm analytics failed")
+        return {"snapshot": False, **dict.fromkeys(targets, False)}
+    
+    results = await asyncio.gather(
+        *(target() for target in targets.values()), return_exceptions=True
+    )
+    warmed = {"snapshot": True}
+    for name, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            logger.error("Warming %s failed", name, exc_info=result)
+        warmed[name] = not isinstance(result, BaseException)
+    return warmed
+
+
+# ============================================================================
+# Network Export
+# ============================================================================
+
+# Records encoded per chunk of a streamed JSON array
+_STREAM_CHUNK_RECORDS = 1000
+
+# AnalyticsResult and GraphVersion are bookkeeping, not part of the network
+_NETWORK_NODES_QUERY = """
+    MATCH (n)
+    WHERE NOT n:AnalyticsResult AND NOT n:GraphVersion
+    RETURN coalesce(n.id, n.name) as id, n.name as name,
+           coalesce(n.type, labels(n)[0]) as type
+"""
+
+_NETWORK_EDGES_QUERY = """
+    MATCH (s)-[e]->(t)
+    RETURN s.id as source, t.id as target,
+           type(e) as type, e.layer as layer, e.sign as sign
+"""
+
+
+async def _json_array_items(result) -> AsyncIterator[bytes]:
+    """Comma-separated JSON for each record of a result, in chunks."""
+    chunk: List[bytes] = []
+    first = True
+    async for record in result:
+        chunk.append(orjson.dumps(record.data()))
+        if len(chunk) == _STREAM_CHUNK_RECORDS:
+            yield (b"" if first else b",") + b",".join(chunk)
+            chunk.clear()
+            first = False
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+
+
+async def _stream_network() -> AsyncIterator[bytes]:
+    """
+    Encode {"nodes": [...], "edges": [...]} as the records arrive, so
+    neither list is ever held in memory whole.
+    
+    The session is opened on first iteration and closed with the
+    generator: when iteration ends, or, if the response is dropped before
+    it finishes, when the event loop finalizes the generator.
+    """
+    async with db_client.driver.session() as session:
+        nodes_result = await session.run(_NETWORK_NODES_QUERY)
+        yield b'{"nodes":['
+        async for chunk in _json_array_items(nodes_result):
+            yield chunk
+        yield b'],"edges":['
+        edges_result = await session.run(_NETWORK_EDGES_QUERY)
+        async for chunk in _json_array_items(edges_result):
+            yield chunk
+        yield b"]}"
+
+
+async def _prepend(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield first, then everything rest yields."""
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+
+# ============================================================================
+# Congress.gov Ingest
+# ============================================================================
+
+# Bills whose detail and cosponsor requests may be in flight at once
+_CONGRESS_FETCH_CONCURRENCY = 10
+
+CongressBatch = Dict[str, List[Dict[str, Any]]]
+
+
+def _empty_congress_batch() -> CongressBatch:
+    """Row lists for one ingest run, keyed as merge_congress_batch expects."""
+    return {
+        "bills": [],
+        "legislators": [],
+        "committees": [],
+        "sponsored": [],
+        "cosponsored": [],
+        "referred": [],
+    }
+
+
+def _unique_rows(rows: List[Dict[str, Any]], *fields: str) -> List[Dict[str, Any]]:
+    """The first row for each distinct value of fields, in order."""
+    first: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for row in rows:
+        first.setdefault(tuple(row[field] for field in fields), row)
+    return list(first.values())
+
+
+def _dedupe_congress_batch(batch: CongressBatch) -> CongressBatch:
+    """
+    Collapse legislators, committees and relationships repeated across bills.
+    
+    Keeping each entity's first row matches what ON CREATE SET applied
+    anyway, and MERGE made repeated relationships no-ops, so the graph
+    written is unchanged with far fewer rows.
+    """
+    return {
+        "bills": batch["bills"],
+        "legislators": _unique_rows(batch["legislators"], "id"),
+        "committees": _unique_rows(batch["committees"], "id"),
+        "sponsored": _unique_rows(batch["sponsored"], "legislator_id", "bill_id"),
+        "cosponsored": _unique_rows(batch["cosponsored"], "legislator_id", "bill_id"),
+        "referred": _unique_rows(batch["referred"], "bill_id", "committee_id"),
+    }
+
+
+async def _fetch_bill_rows(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    bill: Dict[str, Any],
+    api_key: str,
+    bill_type: str,
+    congress: int
+) -> Tuple[CongressBatch, int, int, List[str]]:
+    """
+    Fetch one bill's details and cosponsors and turn them into rows.
+    
+    Returns (rows, nodes_created, edges_created, errors); a failure part
+    way through keeps the rows gathered so far.
+    """
+    batch = _empty_congress_batch()
+    nodes_created = 0
+    edges_created = 0
+    errors: List[str] = []
+    
+    try:
+        bill_number = bill.get("number", "")
+        if not bill_number:
+            return batch, nodes_created, edges_created, errors
+        bill_title = (bill.get("title") or "")[:500]
+        bill_id = f"{bill_type}-{bill_number}"
+        
+        # Safe access to latestAction
+        latest_action_obj = bill.get("latestAction") or {}
+        latest_action = latest_action_obj.get("text", "") if isinstance(latest_action_obj, dict) else ""
+        action_date = latest_action_obj.get("actionDate", "") if isinstance(latest_action_obj, dict) else ""
+        
+        # Bill node
+        batch["bills"].append({
+            "id": bill_id, "number": str(bill_number), "title": bill_title,
+            "type": bill_type.upper(), "congress": congress,
+            "latestAction": latest_action, "actionDate": action_date,
+        })
+        nodes_created += 1
+        
+        # Fetch detailed bill info for sponsors and committees
+        detail_url = bill.get("url")
+        if not detail_url:
+            return batch, nodes_created, edges_created, errors
+        
+        async with semaphore:
+            try:
+                detail_response = await client.get(f"{detail_url}?api_key={api_key}")
+                if detail_response.status_code == 200:
+                    detail = detail_response.json().get("bill") or {}
+                    
+                    # Process sponsors
+                    sponsors = detail.get("sponsors") or []
+                    for sponsor in sponsors:
+                        if not isinstance(sponsor, dict):
+                            continue
+                        sponsor_id = sponsor.get("bioguideId", "")
+                        if sponsor_id:
+                            sponsor_name = f"{sponsor.get('firstName', '')} {sponsor.get('lastName', '')}".strip()
+                            batch["legislators"].append({
+                                "id": sponsor_id, "name": sponsor_name,
+                                "party": sponsor.get("party", ""),
+                                "state": sponsor.get("state", ""),
+                            })
+                            nodes_created += 1
+                            
+                            batch["sponsored"].append({"legislator_id": sponsor_id, "bill_id": bill_id})
+                            edges_created += 1
+                    
+                    # Process cosponsors - safely access nested URL
+                    cosponsors_obj = detail.get("cosponsors") or {}
+                    cosponsors_url = cosponsors_obj.get("url") if isinstance(cosponsors_obj, dict) else None
+                    if cosponsors_url:
+                        try:
+                            cosponsor_resp = await client.get(f"{cosponsors_url}?api_key={api_key}&limit=20")
+                            if cosponsor_resp.status_code == 200:
+                                cosponsor_data = cosponsor_resp.json().get("cosponsors") or []
+                                for cosponsor in cosponsor_data[:10]:
+                                    if not isinstance(cosponsor, dict):
+                                        continue
+                                    cosponsor_id = cosponsor.get("bioguideId", "")
+                                    if cosponsor_id:
+                                        cosponsor_name = f"{cosponsor.get('firstName', '')} {cosponsor.get('lastName', '')}".strip()
+                                        batch["legislators"].append({
+                                            "id": cosponsor_id, "name": cosponsor_name,
+                                            "party": cosponsor.get("party", ""),
+                                            "state": cosponsor.get("state", ""),
+                                        })
+                                        nodes_created += 1
+                                        
+                                        batch["cosponsored"].append({"legislator_id": cosponsor_id, "bill_id": bill_id})
+                                        edges_created += 1
+                        except Exception:
+                            pass  # Skip cosponsors on error
+                    
+                    # Process committees - safely access
+                    committees_obj = detail.get("committees") or {}
+                    committees = []
+                    if isinstance(committees_obj, dict):
+                        committees_item = committees_obj.get("item") or []
+                        if isinstance(committees_item, dict):
+                            committees = [committees_item]
+                        elif isinstance(committees_item, list):
+                            committees = committees_item
+                    
+                    for committee in committees[:5]:
+                        if not isinstance(committee, dict):
+                            continue
+                        comm_name = committee.get("name", "")
+                        if not comm_name:
+                            continue
+                        comm_id = comm_name.lower().replace(" ", "_")[:30]
+                        chamber = committee.get("chamber", "")
+                        
+                        batch["committees"].append({"id": comm_id, "name": comm_name, "chamber": chamber})
+                        nodes_created += 1
+                        
+                        batch["referred"].append({"bill_id": bill_id, "committee_id": comm_id})
+                        edges_created += 1
+                        
+                        # Committee is linked to Congress
+                        edges_created += 1
+            except Exception as e:
+                errors.append(f"Bill {bill_id}: {str(e)}")
+    except Exception as e:
+        errors.append(f"Bill processing error: {str(e)}")
+    
+    return batch, nodes_created, edges_created, errors
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint."""
     db_status = "connected"
-    try:
-        if db_client:
-            with db_client.driver.session() as session:
-                session.run("RETURN 1")
-    except Exception:
-        db_status = "disconnected"
+    if db_client:
+        db_status = health_cache.get("database")
+        if db_status is None:
+            connected = await db_client.ping(_HEALTH_PROBE_TIMEOUT)
+            db_status = "connected" if connected else "disconnected"
+            health_cache["database"] = db_status
     
-    return HealthResponse(status="healthy", database=db_status)
+    return _model_response(HealthResponse.model_construct(status="healthy", database=db_status))
 
 
 @app.get("/metrics")
@@ -227,30 +1271,15 @@ async def get_network_data():
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
+    # Advance to the first chunk here, so connection and query errors
+    # surface as a 500 before the response starts streaming
+    stream = _stream_network()
     try:
-        with db_client.driver.session() as session:
-            # Get all nodes
-            nodes_result = session.run("""
-                MATCH (n)
-                RETURN n.id as id, n.name as name, n.type as type, 
-                       labels(n)[0] as label
-            """)
-            nodes = [{"id": r["id"] or r["name"], "name": r["name"], 
-                      "type": r["type"] or r["label"]} for r in nodes_result]
-            
-            # Get all edges
-            edges_result = session.run("""
-                MATCH (s)-[e]->(t)
-                RETURN s.id as source, t.id as target, 
-                       type(e) as type, e.layer as layer, e.sign as sign
-            """)
-            edges = [{"source": r["source"], "target": r["target"], 
-                      "type": r["type"], "layer": r["layer"], 
-                      "sign": r["sign"]} for r in edges_result]
-        
-        return {"nodes": nodes, "edges": edges}
+        first = await anext(stream)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(_prepend(first, stream), media_type="application/json")
 
 
 @app.post("/analytics/ingest-congress-data")
@@ -263,8 +1292,6 @@ async def ingest_congress_data(
     Ingest real congressional data from Congress.gov API.
     Creates network nodes for bills, sponsors, committees, and their relationships.
     """
-    import httpx
-    
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
@@ -272,153 +1299,38 @@ async def ingest_congress_data(
     base_url = f"https://api.congress.gov/v3/bill/{congress}/{bill_type}"
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            # Fetch bills list
-            response = await client.get(f"{base_url}?api_key={api_key}&limit={limit}")
-            response.raise_for_status()
-            bills_data = response.json()
-            
-            nodes_created = 0
-            edges_created = 0
-            errors = []
-            
-            with db_client.driver.session() as session:
-                # Create Congress node
-                session.run("""
-                    MERGE (c:Institution {id: $id})
-                    SET c.name = $name, c.type = 'Congress', c.congress = $congress
-                """, id=f"congress-{congress}", name=f"{congress}th Congress", congress=congress)
-                nodes_created += 1
-                
-                for bill in bills_data.get("bills", []):
-                    try:
-                        bill_number = bill.get("number", "")
-                        if not bill_number:
-                            continue
-                        bill_title = (bill.get("title") or "")[:500]
-                        bill_id = f"{bill_type}-{bill_number}"
-                        
-                        # Safe access to latestAction
-                        latest_action_obj = bill.get("latestAction") or {}
-                        latest_action = latest_action_obj.get("text", "") if isinstance(latest_action_obj, dict) else ""
-                        action_date = latest_action_obj.get("actionDate", "") if isinstance(latest_action_obj, dict) else ""
-                        
-                        # Create Bill node
-                        session.run("""
-                            MERGE (b:Bill {id: $id})
-                            SET b.number = $number, b.title = $title, b.type = $bill_type,
-                                b.congress = $congress, b.latestAction = $action,
-                                b.actionDate = $actionDate
-                        """, id=bill_id, number=str(bill_number), title=bill_title,
-                             bill_type=bill_type.upper(), congress=congress,
-                             action=latest_action, actionDate=action_date)
-                        nodes_created += 1
-                        
-                        # Fetch detailed bill info for sponsors and committees
-                        detail_url = bill.get("url")
-                        if detail_url:
-                            try:
-                                detail_response = await client.get(f"{detail_url}?api_key={api_key}")
-                                if detail_response.status_code == 200:
-                                    detail = detail_response.json().get("bill") or {}
-                                    
-                                    # Process sponsors
-                                    sponsors = detail.get("sponsors") or []
-                                    for sponsor in sponsors:
-                                        if not isinstance(sponsor, dict):
-                                            continue
-                                        sponsor_id = sponsor.get("bioguideId", "")
-                                        if sponsor_id:
-                                            sponsor_name = f"{sponsor.get('firstName', '')} {sponsor.get('lastName', '')}".strip()
-                                            party = sponsor.get("party", "")
-                                            state = sponsor.get("state", "")
-                                            
-                                            session.run("""
-                                                MERGE (l:Legislator {id: $id})
-                                                SET l.name = $name, l.party = $party, l.state = $state,
-                                                    l.type = 'Legislator'
-                                            """, id=sponsor_id, name=sponsor_name, party=party, state=state)
-                                            nodes_created += 1
-                                            
-                                            session.run("""
-                                                MATCH (l:Legislator {id: $sponsor_id}), (b:Bill {id: $bill_id})
-                                                MERGE (l)-[:SPONSORED {layer: 'Sponsorship', sign: 1}]->(b)
-                                            """, sponsor_id=sponsor_id, bill_id=bill_id)
-                                            edges_created += 1
-                                    
-                                    # Process cosponsors - safely access nested URL
-                                    cosponsors_obj = detail.get("cosponsors") or {}
-                                    cosponsors_url = cosponsors_obj.get("url") if isinstance(cosponsors_obj, dict) else None
-                                    if cosponsors_url:
-                                        try:
-                                            cosponsor_resp = await client.get(f"{cosponsors_url}?api_key={api_key}&limit=20")
-                                            if cosponsor_resp.status_code == 200:
-                                                cosponsor_data = cosponsor_resp.json().get("cosponsors") or []
-                                                for cosponsor in cosponsor_data[:10]:
-                                                    if not isinstance(cosponsor, dict):
-                                                        continue
-                                                    cosponsor_id = cosponsor.get("bioguideId", "")
-                                                    if cosponsor_id:
-                                                        cosponsor_name = f"{cosponsor.get('firstName', '')} {cosponsor.get('lastName', '')}".strip()
-                                                        
-                                                        session.run("""
-                                                            MERGE (l:Legislator {id: $id})
-                                                            SET l.name = $name, l.party = $party, l.state = $state,
-                                                                l.type = 'Legislator'
-                                                        """, id=cosponsor_id, name=cosponsor_name,
-                                                             party=cosponsor.get("party", ""),
-                                                             state=cosponsor.get("state", ""))
-                                                        nodes_created += 1
-                                                        
-                                                        session.run("""
-                                                            MATCH (l:Legislator {id: $cosponsor_id}), (b:Bill {id: $bill_id})
-                                                            MERGE (l)-[:COSPONSORED {layer: 'Sponsorship', sign: 1}]->(b)
-                                                        """, cosponsor_id=cosponsor_id, bill_id=bill_id)
-                                                        edges_created += 1
-                                        except Exception:
-                                            pass  # Skip cosponsors on error
-                                    
-                                    # Process committees - safely access
-                                    committees_obj = detail.get("committees") or {}
-                                    committees = []
-                                    if isinstance(committees_obj, dict):
-                                        committees_item = committees_obj.get("item") or []
-                                        if isinstance(committees_item, dict):
-                                            committees = [committees_item]
-                                        elif isinstance(committees_item, list):
-                                            committees = committees_item
-                                    
-                                    for committee in committees[:5]:
-                                        if not isinstance(committee, dict):
-                                            continue
-                                        comm_name = committee.get("name", "")
-                                        if not comm_name:
-                                            continue
-                                        comm_id = comm_name.lower().replace(" ", "_")[:30]
-                                        chamber = committee.get("chamber", "")
-                                        
-                                        session.run("""
-                                            MERGE (c:Committee {id: $id})
-                                            SET c.name = $name, c.chamber = $chamber, c.type = 'Committee'
-                                        """, id=comm_id, name=comm_name, chamber=chamber)
-                                        nodes_created += 1
-                                        
-                                        session.run("""
-                                            MATCH (b:Bill {id: $bill_id}), (c:Committee {id: $comm_id})
-                                            MERGE (b)-[:REFERRED_TO {layer: 'Legislative', sign: 1}]->(c)
-                                        """, bill_id=bill_id, comm_id=comm_id)
-                                        edges_created += 1
-                                        
-                                        # Link committee to Congress
-                                        session.run("""
-                                            MATCH (c:Committee {id: $comm_id}), (cong:Institution {id: $cong_id})
-                                            MERGE (c)-[:PART_OF {layer: 'Legislative', sign: 1}]->(cong)
-                                        """, comm_id=comm_id, cong_id=f"congress-{congress}")
-                                        edges_created += 1
-                            except Exception as e:
-                                errors.append(f"Bill {bill_id}: {str(e)}")
-                    except Exception as e:
-                        errors.append(f"Bill processing error: {str(e)}")
+        # Fetch bills list
+        response = await http_client.get(f"{base_url}?api_key={api_key}&limit={limit}")
+        response.raise_for_status()
+        bills_data = response.json()
+        
+        # Fetch every bill's details concurrently; results come back in
+        # bill order, so rows merge in the same order as a serial fetch
+        semaphore = asyncio.Semaphore(_CONGRESS_FETCH_CONCURRENCY)
+        results = await asyncio.gather(*(
+            _fetch_bill_rows(http_client, semaphore, bill, api_key, bill_type, congress)
+            for bill in bills_data.get("bills", [])
+        ))
+        
+        # Congress node
+        nodes_created = 1
+        edges_created = 0
+        errors: List[str] = []
+        batch = _empty_congress_batch()
+        
+        for bill_batch, bill_nodes, bill_edges, bill_errors in results:
+            for key, rows in bill_batch.items():
+                batch[key].extend(rows)
+            nodes_created += bill_nodes
+            edges_created += bill_edges
+            errors.extend(bill_errors)
+        
+        graph_version_cache["version"] = await db_client.merge_congress_batch(
+            {"id": f"congress-{congress}", "name": f"{congress}th Congress", "congress": congress},
+            _dedupe_congress_batch(batch)
+        )
+        # Precompute the default analytics for the new version off-request
+        _spawn_background(_warm_analytics())
         
         return {
             "success": True,
@@ -435,7 +1347,7 @@ async def ingest_congress_data(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/analytics/frustration/{layer}", response_model=FrustrationResponse)
+@app.get("/analytics/frustration/{layer}", response_model=None, responses={200: {"model": FrustrationResponse}})
 async def compute_frustration(layer: str):
     """
     Compute frustration index for a network layer.
@@ -443,31 +1355,34 @@ async def compute_frustration(layer: str):
     The frustration index is the minimum number of edges to remove
     to achieve structural balance.
     """
-    REQUEST_COUNT.labels(endpoint="frustration", status="started").inc()
+    FRUSTRATION_STARTED.inc()
     
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_layer_edges(layer)
-    
-    if not edges:
-        raise HTTPException(status_code=404, detail=f"No edges found in layer '{layer}'")
+    async def compute() -> Dict[str, Any]:
+        edges = await db_client.get_layer_edges(layer)
+        
+        if not edges:
+            raise HTTPException(status_code=404, detail=f"No edges found in layer '{layer}'")
+        
+        result = await _run_analytics(_structural_balance, edges)
+        
+        return {
+            "frustration_index": result.frustration_index,
+            "is_balanced": result.is_balanced,
+            "frustrated_edges": [list(e) for e in result.frustrated_edges],
+            "balance_ratio": result.balance_ratio,
+        }
     
-    graph = create_signed_graph_from_edges(edges)
-    analyzer = SignedNetworkAnalyzer(graph)
-    result = analyzer.compute_structural_balance()
+    result = await _cached_analytics("frustration", (layer,), compute)
     
-    REQUEST_COUNT.labels(endpoint="frustration", status="success").inc()
+    FRUSTRATION_SUCCESS.inc()
     
-    return FrustrationResponse(
-        frustration_index=result.frustration_index,
-        is_balanced=result.is_balanced,
-        frustrated_edges=[list(e) for e in result.frustrated_edges],
-        balance_ratio=result.balance_ratio
-    )
+    return _model_response(FrustrationResponse.model_construct(**result))
 
 
-@app.get("/analytics/triangles/{layer}", response_model=TriangleResponse)
+@app.get("/analytics/triangles/{layer}", response_model=None, responses={200: {"model": TriangleResponse}})
 async def analyze_triangles(layer: str):
     """
     Analyze structural balance through triangle enumeration.
@@ -475,26 +1390,35 @@ async def analyze_triangles(layer: str):
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_layer_edges(layer)
-    
-    if not edges:
-        raise HTTPException(status_code=404, detail=f"No edges found in layer '{layer}'")
+    async def compute() -> Dict[str, Any]:
+        try:
+            counts = await db_client.count_layer_triangles(layer)
+            result = triangle_analysis_from_counts(*counts) if counts else None
+        except ClientError:
+            # The server cannot run the in-database count; analyze in Python
+            edges = await db_client.get_layer_edges(layer)
+            result = await _run_analytics(_triangle_analysis, edges) if edges else None
+        
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"No edges found in layer '{layer}'")
+        
+        return {
+            "total_triangles": result.total_triangles,
+            "balanced_triangles": result.balanced_triangles,
+            "frustrated_triangles": result.frustrated_triangles,
+            "balance_ratio": result.balance_ratio,
+        }
     
-    graph = create_signed_graph_from_edges(edges)
-    analyzer = SignedNetworkAnalyzer(graph)
-    result = analyzer.analyze_triangles()
+    result = await _cached_analytics("triangles", (layer,), compute)
     
-    return TriangleResponse(
-        total_triangles=result.total_triangles,
-        balanced_triangles=result.balanced_triangles,
-        frustrated_triangles=result.frustrated_triangles,
-        balance_ratio=result.balance_ratio
-    )
+    return _model_response(TriangleResponse.model_construct(**result))
 
 
-@app.get("/analytics/centrality/multiplex", response_model=CentralityResponse)
+@app.get("/analytics/centrality/multiplex", response_model=None, responses={200: {"model": CentralityResponse}})
 async def compute_multiplex_centrality(
-    method: str = Query("aggregate", enum=["aggregate", "max", "harmonic"])
+    request: Request,
+    method: str = Query(DEFAULT_CENTRALITY_METHOD, enum=["aggregate", "max", "harmonic"]),
+    layers: Optional[List[str]] = Query(None, description="Only analyze these layers")
 ):
     """
     Compute aggregate centrality across all network layers.
@@ -502,61 +1426,62 @@ async def compute_multiplex_centrality(
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_all_edges()
-    
-    if not edges:
-        raise HTTPException(status_code=404, detail="No edges found")
-    
-    # Build layer-separated graphs
-    layers: Dict[str, nx.Graph] = {}
-    for edge in edges:
-        layer = edge.get('layer', 'default')
-        if layer not in layers:
-            layers[layer] = nx.Graph()
-        layers[layer].add_edge(edge['source'], edge['target'])
+    etag, centralities = await _centrality_result(method, _layer_filter(layers))
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
-    analyzer = MultiplexCentralityAnalyzer(layers)
-    centralities = analyzer.compute_multiplex_centrality(method=method)
-    
-    return CentralityResponse(centralities=centralities, method=method)
+    response = _model_response(
+        CentralityResponse.model_construct(centralities=centralities, method=method)
+    )
+    _set_cache_headers(response, etag)
+    return response
 
 
-@app.get("/analytics/centrality/node/{node_id}", response_model=NodeCentralityResponse)
-async def compute_node_centrality(node_id: str):
+@app.get("/analytics/centrality/node/{node_id}", response_model=None, responses={200: {"model": NodeCentralityResponse}})
+async def compute_node_centrality(node_id: str, request: Request):
     """
     Compute comprehensive centrality analysis for a single node.
     """
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_all_edges()
+    # Read before the edges, so a concurrent ingest can only tag newer
+    # data with an older version, which just costs the client a 200
+    version = await _current_graph_version()
     
-    layers: Dict[str, nx.Graph] = {}
-    for edge in edges:
-        layer = edge.get('layer', 'default')
-        if layer not in layers:
-            layers[layer] = nx.Graph()
-        layers[layer].add_edge(edge['source'], edge['target'])
+    # Only the node's own edges and the layer sizes are needed, so the
+    # layer graphs are never built
+    node_edges = tuple(await db_client.get_node_edges(node_id))
+    layer_degrees = _node_layer_degrees(node_id, node_edges)
     
-    analyzer = MultiplexCentralityAnalyzer(layers)
-    
-    if node_id not in analyzer.all_nodes:
+    if not layer_degrees:
         raise HTTPException(status_code=404, detail=f"Node '{node_id}' not found")
     
-    result = analyzer.compute_node_analysis(node_id)
+    layer_sizes = await _layer_sizes()
+    etag = _graph_etag("node", version, node_id)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    
+    result = node_analysis_from_degrees(node_id, layer_degrees, layer_sizes)
     
-    return NodeCentralityResponse(
+    response = _model_response(NodeCentralityResponse.model_construct(
         node_id=result.node_id,
         layer_centralities=result.layer_centralities,
         aggregate_centrality=result.aggregate_centrality,
         versatility=result.versatility,
         participation_coefficient=result.participation_coefficient
-    )
+    ))
+    _set_cache_headers(response, etag)
+    return response
 
 
-@app.get("/analytics/pagerank/multiplex", response_model=CentralityResponse)
+@app.get("/analytics/pagerank/multiplex", response_model=None, responses={200: {"model": CentralityResponse}})
 async def compute_multiplex_pagerank(
-    inter_layer_weight: float = Query(0.5, ge=0, le=1)
+    request: Request,
+    inter_layer_weight: float = Query(DEFAULT_INTER_LAYER_WEIGHT, ge=0, le=1),
+    layers: Optional[List[str]] = Query(None, description="Only analyze these layers")
 ):
     """
     Compute PageRank across the multiplex network.
@@ -564,22 +1489,19 @@ async def compute_multiplex_pagerank(
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_all_edges()
-    
-    layers: Dict[str, nx.Graph] = {}
-    for edge in edges:
-        layer = edge.get('layer', 'default')
-        if layer not in layers:
-            layers[layer] = nx.Graph()
-        layers[layer].add_edge(edge['source'], edge['target'])
-    
-    analyzer = MultiplexCentralityAnalyzer(layers)
-    pagerank = analyzer.compute_multiplex_pagerank(inter_layer_weight=inter_layer_weight)
+    etag, pagerank = await _pagerank_result(inter_layer_weight, _layer_filter(layers))
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
-    return CentralityResponse(centralities=pagerank, method="multiplex_pagerank")
+    response = _model_response(
+        CentralityResponse.model_construct(centralities=pagerank, method="multiplex_pagerank")
+    )
+    _set_cache_headers(response, etag)
+    return response
 
 
-@app.post("/analytics/constraint-dominance", response_model=ConstraintDominanceResponse)
+@app.post("/analytics/constraint-dominance", response_model=None, responses={200: {"model": ConstraintDominanceResponse}})
 async def analyze_constraint_dominance(constraint_nodes: List[str]):
     """
     Analyze which constraints dominate decision-making paths.
@@ -587,23 +1509,17 @@ async def analyze_constraint_dominance(constraint_nodes: List[str]):
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_all_edges()
-    
-    G = nx.DiGraph()
-    for edge in edges:
-        G.add_edge(edge['source'], edge['target'])
+    snapshot, edges = await _layer_edges(None)
+    result = await _run_snapshot_analytics(_constraint_dominance, snapshot, edges, constraint_nodes)
     
-    analyzer = AdvancedInstitutionalMetrics(G)
-    result = analyzer.analyze_constraint_dominance(constraint_nodes)
-    
-    return ConstraintDominanceResponse(
+    return _model_response(ConstraintDominanceResponse.model_construct(
         dominant_constraints=result.dominant_constraints,
         dominance_scores=result.dominance_scores,
         switch_likelihood=result.switch_likelihood
-    )
+    ))
 
 
-@app.get("/analytics/meta-stability", response_model=MetaStabilityResponse)
+@app.get("/analytics/meta-stability", response_model=None, responses={200: {"model": MetaStabilityResponse}})
 async def compute_meta_stability():
     """
     Compute meta-stability of the network configuration.
@@ -611,14 +1527,7 @@ async def compute_meta_stability():
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_all_edges()
-    
-    G = nx.DiGraph()
-    for edge in edges:
-        G.add_edge(edge['source'], edge['target'])
-    
-    analyzer = AdvancedInstitutionalMetrics(G)
-    stability = analyzer.compute_meta_stability()
+    stability = await _meta_stability_result()
     
     interpretation = "stable"
     if stability > 0.7:
@@ -626,13 +1535,13 @@ async def compute_meta_stability():
     elif stability > 0.4:
         interpretation = "moderately meta-stable"
     
-    return MetaStabilityResponse(
+    return _model_response(MetaStabilityResponse.model_construct(
         meta_stability=stability,
         interpretation=interpretation
-    )
+    ))
 
 
-@app.get("/analytics/information-asymmetry", response_model=InformationAsymmetryResponse)
+@app.get("/analytics/information-asymmetry", response_model=None, responses={200: {"model": InformationAsymmetryResponse}})
 async def analyze_information_asymmetry():
     """
     Measure information asymmetry in the network.
@@ -640,20 +1549,25 @@ async def analyze_information_asymmetry():
     if not db_client:
         raise HTTPException(status_code=503, detail="Database not connected")
     
-    edges = db_client.get_all_edges()
+    result = await _information_asymmetry_result()
     
-    G = nx.DiGraph()
-    for edge in edges:
-        G.add_edge(edge['source'], edge['target'])
+    return _model_response(InformationAsymmetryResponse.model_construct(**result))
+
+
+@app.post("/analytics/cache/warm")
+async def warm_analytics_cache():
+    """
+    Precompute the whole-graph analytics for the current graph version.
     
-    analyzer = AdvancedInstitutionalMetrics(G)
-    result = analyzer.measure_information_asymmetry()
+    Ingest already does this in the background after each write; this
+    primes the caches on demand, e.g. after a restart.
+    """
+    if not db_client:
+        raise HTTPException(status_code=503, detail="Database not connected")
     
-    return InformationAsymmetryResponse(
-        gini_coefficient=result.gini_coefficient,
-        information_hubs=result.information_hubs[:10],
-        information_periphery=result.information_periphery[:10]
-    )
+    warmed = await _warm_analytics()
+    
+    return {"graph_version": await _current_graph_version(), "warmed": warmed}
 
 
 # ============================================================================
@@ -667,5 +1581,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.analytics_port,
         reload=False,
-        workers=4
+        # One server process: analytics already fan out over the process
+        # pool, and the in-memory result caches live in this process
+        workers=1,
+        loop="uvloop",
+        http="httptools"
     )
@@ -0,0 +1,47 @@
+"""Tests for advanced institutional metrics."""
+
+import networkx as nx
+import pytest
+
+from src.advanced import institutional_metrics
+from src.advanced.institutional_metrics import AdvancedInstitutionalMetrics
+
+
+def _reference_path_dependence(graph: nx.DiGraph):
+    """Nodes reachable through exactly one junction, by per-successor traversal."""
+    junctions = [n for n in graph.nodes() if graph.out_degree(n) >= 2]
+    path_dependent = {}
+    for junction in junctions:
+        for succ in graph.successors(junction):
+            for node in nx.descendants(graph, succ):
+                path_dependent.setdefault(node, set()).add(junction)
+    single = {n for n, js in path_dependent.items() if len(js) == 1}
+    return junctions, single
+
+
+def _graphs():
+    graphs = []
+    for seed in range(12):
+        # Random DAGs: edges only from lower to higher labels
+        G = nx.gnp_random_graph(25 + seed, 0.12, seed=seed, directed=True)
+        graphs.append(nx.DiGraph((u, v) for u, v in G.edges() if u < v))
+        # General digraphs with cycles and a self-loop
+        G = nx.gnp_random_graph(25 + seed, 0.05, seed=100 + seed, directed=True)
+        G.add_edge(0, 0)
+        graphs.append(G)
+    graphs.append(nx.cycle_graph(6, create_using=nx.DiGraph))
+    graphs.append(nx.DiGraph([("a", "b"), ("a", "c"), ("b", "c"), ("c", "a")]))
+    return [nx.relabel_nodes(G, {n: f"n{n}" for n in G}) for G in graphs]
+
+
+@pytest.mark.parametrize("bitset_max_nodes", [10**9, 0], ids=["bitset", "traversal"])
+@pytest.mark.parametrize("graph", _graphs())
+def test_path_dependence_matches_reference(monkeypatch, graph, bitset_max_nodes):
+    monkeypatch.setattr(institutional_metrics, "_BITSET_MAX_NODES", bitset_max_nodes)
+    junctions, single = _reference_path_dependence(graph)
+    
+    result = AdvancedInstitutionalMetrics(graph).analyze_path_dependence()
+    
+    assert result.critical_junctions == junctions
+    assert sorted(result.path_dependent_nodes) == sorted(single)
+    assert result.lock_in_score == pytest.approx(len(single) / graph.number_of_nodes())
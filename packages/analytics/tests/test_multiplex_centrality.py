@@ -0,0 +1,140 @@
+"""Tests for multiplex centrality metrics."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.centrality import multiplex_centrality
+from src.centrality.multiplex_centrality import MultiplexCentralityAnalyzer
+
+
+def _disconnected_layer(sizes, p, seed):
+    """Disjoint random components of the given sizes, plus an isolated node."""
+    G = nx.Graph()
+    offset = 0
+    for i, size in enumerate(sizes):
+        component = nx.gnp_random_graph(size, p, seed=seed + i)
+        G.update(nx.relabel_nodes(component, {n: f"n{offset + n}" for n in component}))
+        offset += size
+    G.add_node("isolated")
+    return G
+
+
+LAYERS = {
+    "small": _disconnected_layer([12, 8, 5], 0.4, seed=1),
+    # Two identical components share the top eigenvalue
+    "tied": nx.relabel_nodes(
+        nx.disjoint_union(nx.cycle_graph(6), nx.cycle_graph(6)), lambda n: f"c{n}"
+    ),
+    # Above _DENSE_EIGEN_MAX_SIZE, so ARPACK solves the large component
+    "large": _disconnected_layer([150, 40, 3], 0.06, seed=7),
+}
+
+
+def _assert_close(actual, expected, rel=1e-4, abs=1e-6):
+    assert actual.keys() == expected.keys()
+    for node, value in expected.items():
+        assert actual[node] == pytest.approx(value, rel=rel, abs=abs), node
+
+
+@pytest.fixture(params=["igraph", "networkx"])
+def backend(request, monkeypatch):
+    if request.param == "igraph":
+        if multiplex_centrality.igraph is None:
+            pytest.skip("igraph not installed")
+    else:
+        monkeypatch.setattr(multiplex_centrality, "igraph", None)
+    return request.param
+
+
+@pytest.mark.parametrize("layer", LAYERS)
+def test_layer_centralities_match_networkx(backend, layer):
+    G = LAYERS[layer]
+    result = MultiplexCentralityAnalyzer({layer: G}).compute_layer_centralities(layer)
+    
+    _assert_close(result.degree, nx.degree_centrality(G))
+    _assert_close(result.betweenness, nx.betweenness_centrality(G))
+    _assert_close(result.closeness, nx.closeness_centrality(G))
+    # References are converged tightly; the networkx fallback stops once
+    # the L1 change drops below N * 1e-6, hence the looser abs bounds
+    _assert_close(
+        result.eigenvector, nx.eigenvector_centrality(G, max_iter=10000, tol=1e-12), abs=1e-5
+    )
+    _assert_close(result.pagerank, nx.pagerank(G, max_iter=10000, tol=1e-12), abs=1e-4)
+
+
+def test_all_layer_centralities_in_process_pool_match_serial():
+    analyzer = MultiplexCentralityAnalyzer(dict(LAYERS))
+    serial = analyzer.compute_all_layer_centralities()
+    parallel = analyzer.compute_all_layer_centralities(max_workers=2)
+    
+    assert list(parallel) == list(LAYERS)
+    for name in LAYERS:
+        for field in ("degree", "betweenness", "closeness", "eigenvector", "pagerank"):
+            _assert_close(getattr(parallel[name], field), getattr(serial[name], field))
+
+
+def _reference_multiplex_pagerank(layers, inter_layer_weight, damping=0.85):
+    """
+    Power iteration on the supra-graph, state by state.
+    
+    Intra-layer edges are walked both ways, a node present in a layer
+    links to its copies in every other layer with inter_layer_weight,
+    and the mass of dangling states is spread uniformly.
+    """
+    nodes = sorted(set().union(*(G.nodes() for G in layers.values())))
+    idx = {node: i for i, node in enumerate(nodes)}
+    n, L = len(nodes), len(layers)
+    A = np.zeros((n * L, n * L))
+    for l, G in enumerate(layers.values()):
+        for u, v in G.edges():
+            A[l * n + idx[u], l * n + idx[v]] = 1.0
+            A[l * n + idx[v], l * n + idx[u]] = 1.0
+        for node in G.nodes():
+            for other in range(L):
+                if other != l:
+                    A[l * n + idx[node], other * n + idx[node]] += inter_layer_weight
+    
+    out = A.sum(axis=1)
+    dangling = out == 0
+    P = np.divide(A, out[:, None], out=np.zeros_like(A), where=~dangling[:, None])
+    x = np.full(n * L, 1.0 / (n * L))
+    for _ in range(100000):
+        x_next = damping * (x @ P + x[dangling].sum() / (n * L)) + (1 - damping) / (n * L)
+        if np.abs(x_next - x).sum() < 1e-14:
+            break
+        x = x_next
+    scores = x_next.reshape(L, n).sum(axis=0)
+    return dict(zip(nodes, scores / scores.sum()))
+
+
+def _pagerank_layers(n, seed):
+    """Three layers over n nodes with dangling states."""
+    layers = {}
+    for l in range(3):
+        G = nx.gnp_random_graph(n, 3.0 / n, seed=seed + l, directed=(l == 2))
+        G = nx.relabel_nodes(G, lambda i: f"n{i}")
+        # Layer 0 drops some nodes, so their copies there are dangling
+        if l == 0:
+            G.remove_nodes_from([f"n{i}" for i in range(0, n, 5)])
+        layers[f"layer{l}"] = G
+    # Present in a single layer with no edges: dangling when uncoupled,
+    # and absent from layer 0, so its copy there is always dangling
+    layers["layer1"].add_node("loner")
+    return layers
+
+
+@pytest.mark.parametrize("n", [20, 60], ids=["dense", "arpack"])
+@pytest.mark.parametrize("inter_layer_weight", [0.0, 0.5, 1.0])
+def test_multiplex_pagerank_matches_power_iteration(n, inter_layer_weight):
+    layers = _pagerank_layers(n, seed=n)
+    analyzer = MultiplexCentralityAnalyzer(layers)
+    # 3 layers x (n + 1) states: at most _DENSE_EIGEN_MAX_SIZE for n=20
+    supra_size = len(layers) * len(analyzer.all_nodes)
+    assert (supra_size <= multiplex_centrality._DENSE_EIGEN_MAX_SIZE) == (n == 20)
+    
+    result = analyzer.compute_multiplex_pagerank(inter_layer_weight=inter_layer_weight)
+    expected = _reference_multiplex_pagerank(layers, inter_layer_weight)
+    
+    assert sum(result.values()) == pytest.approx(1.0, abs=1e-12)
+    _assert_close(result, expected, rel=1e-4, abs=1e-7)
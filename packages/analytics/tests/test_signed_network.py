@@ -0,0 +1,101 @@
+"""Tests for signed network analysis."""
+
+import itertools
+import random
+
+import networkx as nx
+import pytest
+
+from src.balance.signed_network import SignedNetworkAnalyzer, create_signed_graph_from_edges
+
+
+def _brute_force_frustration(G: nx.Graph) -> int:
+    """Minimum frustrated edges over every assignment of nodes to two sides."""
+    nodes = list(G.nodes())
+    best = G.number_of_edges()
+    for sides in itertools.product((0, 1), repeat=len(nodes)):
+        side = dict(zip(nodes, sides))
+        frustrated = sum(
+            1 for u, v, sign in G.edges(data="sign")
+            if (sign == 1) != (side[u] == side[v])
+        )
+        best = min(best, frustrated)
+    return best
+
+
+def _signed_graphs():
+    graphs = []
+    for seed in range(20):
+        rng = random.Random(seed)
+        n = 2 + seed % 11
+        G = nx.gnp_random_graph(n, 0.3 + 0.03 * (seed % 7), seed=seed)
+        for u, v in G.edges():
+            G[u][v]["sign"] = rng.choice([1, -1])
+        if seed % 4 == 0:
+            G.add_edge(0, 0, sign=-1)
+        graphs.append(G)
+    
+    # The last node, which the Gray-code walk holds fixed, must end up
+    # apart from every other node in the optimum
+    star = nx.Graph()
+    star.add_nodes_from(range(6))
+    star.add_edges_from(((6, leaf) for leaf in range(6)), sign=-1)
+    assert list(star.nodes())[-1] == 6
+    graphs.append(star)
+    
+    # Disconnected components whose best partitions disagree
+    G = nx.Graph()
+    G.add_edges_from([(0, 1), (1, 2)], sign=-1)
+    G.add_edges_from([(3, 4), (4, 5), (3, 5)], sign=1)
+    G.add_edge(6, 7, sign=-1)
+    graphs.append(G)
+    
+    # All-negative triangle: frustrated under every partition
+    triangle = nx.complete_graph(3)
+    nx.set_edge_attributes(triangle, -1, "sign")
+    graphs.append(triangle)
+    return graphs
+
+
+@pytest.mark.parametrize("graph", _signed_graphs())
+def test_exact_frustration_matches_brute_force(graph):
+    analyzer = SignedNetworkAnalyzer(graph)
+    assert analyzer._compute_frustration_exact() == _brute_force_frustration(graph)
+
+
+def test_invalidate_picks_up_in_place_mutations():
+    G = nx.Graph()
+    G.add_edge("a", "b", sign=1)
+    G.add_edge("b", "c", sign=1)
+    G.add_edge("a", "c", sign=1)
+    analyzer = SignedNetworkAnalyzer(G)
+    assert analyzer.compute_structural_balance().frustration_index == 0
+    
+    # Neither change alters the edge count
+    G.add_node("z")
+    G["a"]["b"]["sign"] = -1
+    analyzer._invalidate()
+    
+    result = analyzer.compute_structural_balance()
+    assert result.frustration_index == 1
+    assert set().union(*result.positive_clusters, *result.negative_clusters) == {"a", "b", "c", "z"}
+
+
+def test_edge_signs_follow_labels_and_reject_null():
+    G = create_signed_graph_from_edges([
+        {"source": "a", "target": "b", "sign": "POSITIVE"},
+        {"source": "b", "target": "c", "sign": "NEGATIVE"},
+        {"source": "a", "target": "c", "sign": -1},
+        {"source": "c", "target": "d"},
+    ])
+    assert dict(((u, v), s) for u, v, s in G.edges(data="sign")) == {
+        ("a", "b"): 1, ("a", "c"): -1, ("b", "c"): -1, ("c", "d"): 1
+    }
+    
+    # A property missing in Neo4j reads back as a null sign
+    with pytest.raises(ValueError):
+        create_signed_graph_from_edges([{"source": "a", "target": "b", "sign": None}])
+    with pytest.raises(ValueError):
+        SignedNetworkAnalyzer(create_signed_graph_from_edges(
+            [{"source": "a", "target": "b", "sign": 2}]
+        ))